@@ -20,6 +20,7 @@ import {
   createExecutionContext,
   createStepResult,
 } from '@marktoflow/core';
+import { countByStatus } from '../utils/index.js';
 
 // Re-export SDKRegistryLike type from engine
 export interface SDKRegistryLike {
@@ -287,12 +288,9 @@ export class WorkflowDebugger {
     console.log(chalk.bold('Current State:'));
     console.log(`  Step: ${this.state.currentStepIndex + 1}/${this.workflow.steps.length}`);
     console.log(`  Variables: ${Object.keys(this.state.context.variables).length}`);
-    console.log(
-      `  Completed: ${this.state.stepResults.filter((r) => r.status === StepStatus.COMPLETED).length}`
-    );
-    console.log(
-      `  Failed: ${this.state.stepResults.filter((r) => r.status === StepStatus.FAILED).length}`
-    );
+    const counts = countByStatus(this.state.stepResults);
+    console.log(`  Completed: ${counts[StepStatus.COMPLETED] ?? 0}`);
+    console.log(`  Failed: ${counts[StepStatus.FAILED] ?? 0}`);
   }
 
   /**
@@ -473,11 +471,10 @@ export class WorkflowDebugger {
   private displaySummary(): void {
     console.log(chalk.bold.green('\n✓ Debug session complete\n'));
 
-    const completed = this.state.stepResults.filter(
-      (r) => r.status === StepStatus.COMPLETED
-    ).length;
-    const failed = this.state.stepResults.filter((r) => r.status === StepStatus.FAILED).length;
-    const skipped = this.state.stepResults.filter((r) => r.status === StepStatus.SKIPPED).length;
+    const counts = countByStatus(this.state.stepResults);
+    const completed = counts[StepStatus.COMPLETED] ?? 0;
+    const failed = counts[StepStatus.FAILED] ?? 0;
+    const skipped = counts[StepStatus.SKIPPED] ?? 0;
 
     console.log(chalk.bold('Summary:'));
     console.log(`  Total steps: ${this.workflow.steps.length}`);
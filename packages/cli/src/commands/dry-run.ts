@@ -8,6 +8,7 @@
 import chalk from 'chalk';
 import type { Workflow, ExecutionContext } from '@marktoflow/core';
 import { WorkflowStatus } from '@marktoflow/core';
+import { countByStatus } from '../utils/index.js';
 
 // ============================================================================
 // Mock Response Generator
@@ -419,9 +420,10 @@ function displayStepResult(result: DryRunStepResult, options: DryRunOptions): vo
 export function displayDryRunSummary(result: DryRunResult, options: DryRunOptions): void {
   console.log(chalk.bold.cyan('\n📊 Dry Run Summary\n'));
 
-  const completed = result.steps.filter((s) => s.status === 'completed').length;
-  const skipped = result.steps.filter((s) => s.status === 'skipped').length;
-  const failed = result.steps.filter((s) => s.status === 'would-fail').length;
+  const counts = countByStatus(result.steps);
+  const completed = counts['completed'] ?? 0;
+  const skipped = counts['skipped'] ?? 0;
+  const failed = counts['would-fail'] ?? 0;
 
   console.log(`  ${chalk.green('✓')} Completed: ${completed}`);
   if (skipped > 0) console.log(`  ${chalk.yellow('○')} Skipped: ${skipped}`);
@@ -312,6 +312,28 @@ output_variable: step1_result
   },
 ];
 
+// Lookups built once from the template list, rather than searched and
+// regrouped each time the wizard or the template listing runs
+const templatesById = new Map(templates.map((t) => [t.id, t]));
+
+const templatesByCategory = templates.reduce(
+  (acc, template) => {
+    if (!acc[template.category]) {
+      acc[template.category] = [];
+    }
+    acc[template.category].push(template);
+    return acc;
+  },
+  {} as Record<string, WorkflowTemplate[]>
+);
+
+function templateChoices(category: WorkflowTemplate['category']) {
+  return (templatesByCategory[category] ?? []).map((t) => ({
+    name: `  ${t.name} - ${chalk.gray(t.description)}`,
+    value: t.id,
+  }));
+}
+
 // ============================================================================
 // Wizard Functions
 // ============================================================================
@@ -324,7 +346,7 @@ export async function runWorkflowWizard(options: { output?: string; template?: s
     let selectedTemplate: WorkflowTemplate;
 
     if (options.template) {
-      const template = templates.find((t) => t.id === options.template);
+      const template = templatesById.get(options.template);
       if (!template) {
         console.error(chalk.red(`Template "${options.template}" not found`));
         process.exit(1);
@@ -339,49 +361,29 @@ export async function runWorkflowWizard(options: { output?: string; template?: s
             value: 'category-communication',
             disabled: true,
           },
-          ...templates
-            .filter((t) => t.category === 'communication')
-            .map((t) => ({
-              name: `  ${t.name} - ${chalk.gray(t.description)}`,
-              value: t.id,
-            })),
+          ...templateChoices('communication'),
           {
             name: `${chalk.green('Development')}`,
             value: 'category-development',
             disabled: true,
           },
-          ...templates
-            .filter((t) => t.category === 'development')
-            .map((t) => ({
-              name: `  ${t.name} - ${chalk.gray(t.description)}`,
-              value: t.id,
-            })),
+          ...templateChoices('development'),
           {
             name: `${chalk.yellow('Operations')}`,
             value: 'category-operations',
             disabled: true,
           },
-          ...templates
-            .filter((t) => t.category === 'operations')
-            .map((t) => ({
-              name: `  ${t.name} - ${chalk.gray(t.description)}`,
-              value: t.id,
-            })),
+          ...templateChoices('operations'),
           {
             name: `${chalk.magenta('Custom')}`,
             value: 'category-custom',
             disabled: true,
           },
-          ...templates
-            .filter((t) => t.category === 'custom')
-            .map((t) => ({
-              name: `  ${t.name} - ${chalk.gray(t.description)}`,
-              value: t.id,
-            })),
+          ...templateChoices('custom'),
         ],
       });
 
-      selectedTemplate = templates.find((t) => t.id === templateChoice)!;
+      selectedTemplate = templatesById.get(templateChoice)!;
     }
 
     console.log(chalk.cyan(`\n✨ Selected: ${selectedTemplate.name}\n`));
@@ -482,17 +484,6 @@ export async function runWorkflowWizard(options: { output?: string; template?: s
 export function listTemplates() {
   console.log(chalk.bold.cyan('\n📚 Available Workflow Templates\n'));
 
-  const byCategory = templates.reduce(
-    (acc, template) => {
-      if (!acc[template.category]) {
-        acc[template.category] = [];
-      }
-      acc[template.category].push(template);
-      return acc;
-    },
-    {} as Record<string, WorkflowTemplate[]>
-  );
-
   const categoryColors = {
     communication: chalk.blue,
     development: chalk.green,
@@ -507,7 +498,7 @@ export function listTemplates() {
     custom: 'Custom',
   };
 
-  for (const [category, templates] of Object.entries(byCategory)) {
+  for (const [category, templates] of Object.entries(templatesByCategory)) {
     const color = categoryColors[category as keyof typeof categoryColors];
     const name = categoryNames[category as keyof typeof categoryNames];
 
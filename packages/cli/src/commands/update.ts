@@ -23,15 +23,23 @@ interface CodingAgent {
   available: boolean;
 }
 
+// PATH lookups are memoized so repeated agent detection doesn't re-spawn `which`
+const commandAvailability = new Map<string, Promise<boolean>>();
+
 /**
  * Check if a command is available in PATH
  */
 async function isCommandAvailable(command: string): Promise<boolean> {
-  return new Promise((resolve) => {
-    const process = spawn('which', [command], { stdio: 'ignore' });
-    process.on('close', (code) => resolve(code === 0));
-    process.on('error', () => resolve(false));
-  });
+  let available = commandAvailability.get(command);
+  if (!available) {
+    available = new Promise((resolve) => {
+      const process = spawn('which', [command], { stdio: 'ignore' });
+      process.on('close', (code) => resolve(code === 0));
+      process.on('error', () => resolve(false));
+    });
+    commandAvailability.set(command, available);
+  }
+  return available;
 }
 
 /**
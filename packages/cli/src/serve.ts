@@ -1,4 +1,3 @@
-import { Command } from 'commander';
 import {
   parseFile,
   WorkflowEngine,
@@ -13,11 +12,10 @@ import {
   type WebhookResponse,
   type Workflow,
 } from '@marktoflow/core';
-import { SlackSocketTrigger } from '@marktoflow/integrations';
 import { readdirSync, existsSync } from 'node:fs';
 import { join, resolve } from 'node:path';
 import chalk from 'chalk';
-import { registerIntegrations } from '@marktoflow/integrations';
+import { onShutdown } from './utils/index.js';
 
 interface WebhookWorkflow {
   path: string;
@@ -71,46 +69,52 @@ function buildInputs(
   return inputs;
 }
 
-export const serveCommand = new Command('serve')
-  .description('Start webhook server to receive events and trigger workflows')
-  .option('-p, --port <port>', 'Server port (for HTTP mode)', '3000')
-  .option('-H, --host <host>', 'Server host (for HTTP mode)', '0.0.0.0')
-  .option('-d, --dir <path>', 'Workflow directory', '.')
-  .option('-w, --workflow <path>', 'Single workflow file to serve')
-  .option('--agent <agent>', 'Default agent for workflows', 'claude-code')
-  .option('--socket', 'Use Slack Socket Mode (no public URL needed)')
-  .option('--app-token <token>', 'Slack App Token for Socket Mode (or SLACK_APP_TOKEN env)')
-  .option('--bot-token <token>', 'Slack Bot Token for Socket Mode (or SLACK_BOT_TOKEN env)')
-  .action(async (options) => {
-    const port = parseInt(options.port, 10);
-    const host = options.host;
-    const workflowDir = options.dir;
-    const singleWorkflow = options.workflow;
-    const defaultAgent = options.agent;
-    const useSocketMode = options.socket;
-
-    // Get tokens from options or environment
-    const appToken = options.appToken || process.env.SLACK_APP_TOKEN;
-    const botToken = options.botToken || process.env.SLACK_BOT_TOKEN;
-
-    if (useSocketMode) {
-      await startSocketMode({
-        workflowDir,
-        singleWorkflow,
-        defaultAgent,
-        appToken,
-        botToken,
-      });
-    } else {
-      await startHttpMode({
-        port,
-        host,
-        workflowDir,
-        singleWorkflow,
-        defaultAgent,
-      });
-    }
-  });
+/** Options of the `serve` command */
+export interface ServeOptions {
+  port: string;
+  host: string;
+  dir: string;
+  workflow?: string;
+  agent: string;
+  socket?: boolean;
+  appToken?: string;
+  botToken?: string;
+}
+
+/**
+ * Run the `serve` command: receive events and trigger workflows until the
+ * process exits
+ */
+export async function runServe(options: ServeOptions): Promise<void> {
+  const port = parseInt(options.port, 10);
+  const host = options.host;
+  const workflowDir = options.dir;
+  const singleWorkflow = options.workflow;
+  const defaultAgent = options.agent;
+  const useSocketMode = options.socket;
+
+  // Get tokens from options or environment
+  const appToken = options.appToken || process.env.SLACK_APP_TOKEN;
+  const botToken = options.botToken || process.env.SLACK_BOT_TOKEN;
+
+  if (useSocketMode) {
+    await startSocketMode({
+      workflowDir,
+      singleWorkflow,
+      defaultAgent,
+      appToken,
+      botToken,
+    });
+  } else {
+    await startHttpMode({
+      port,
+      host,
+      workflowDir,
+      singleWorkflow,
+      defaultAgent,
+    });
+  }
+}
 
 /**
  * Start Slack Socket Mode server
@@ -144,6 +148,7 @@ async function startSocketMode(options: {
 
   const stateStore = new StateStore();
   const engine = new WorkflowEngine({ defaultAgent }, {}, stateStore);
+  const { registerIntegrations, SlackSocketTrigger } = await import('@marktoflow/integrations');
   const registry = new SDKRegistry();
   registerIntegrations(registry);
 
@@ -267,24 +272,19 @@ triggers:
 
   await socketTrigger.start();
 
-  console.log(chalk.green('\n✓ Slack Socket Mode connected!'));
-  console.log(chalk.gray('\nListening for events:'));
-  for (const trigger of triggers) {
-    console.log(chalk.cyan(`  ${trigger.event}`) + chalk.gray(` → ${trigger.id}`));
-  }
-  console.log(chalk.gray('\nNo public URL needed. Press Ctrl+C to stop.\n'));
-
-  // Handle graceful shutdown
-  process.on('SIGINT', async () => {
-    console.log(chalk.yellow('\nShutting down...'));
-    await socketTrigger.stop();
-    process.exit(0);
-  });
+  // Write the startup banner in one call rather than one per event
+  console.log(
+    [
+      chalk.green('\n✓ Slack Socket Mode connected!'),
+      chalk.gray('\nListening for events:'),
+      ...triggers.map(
+        (trigger) => chalk.cyan(`  ${trigger.event}`) + chalk.gray(` → ${trigger.id}`)
+      ),
+      chalk.gray('\nNo public URL needed. Press Ctrl+C to stop.\n'),
+    ].join('\n')
+  );
 
-  process.on('SIGTERM', async () => {
-    await socketTrigger.stop();
-    process.exit(0);
-  });
+  onShutdown(() => socketTrigger.stop());
 
   // Keep process alive
   await new Promise(() => {});
@@ -306,6 +306,7 @@ async function startHttpMode(options: {
 
   const stateStore = new StateStore();
   const engine = new WorkflowEngine({ defaultAgent }, {}, stateStore);
+  const { registerIntegrations } = await import('@marktoflow/integrations');
   const registry = new SDKRegistry();
   registerIntegrations(registry);
 
@@ -463,24 +464,19 @@ triggers:
   // Start the server
   await receiver.start();
 
-  console.log(chalk.green(`\n✓ Webhook server running on http://${host}:${port}`));
-  console.log(chalk.gray('\nEndpoints:'));
-  for (const [path] of webhookWorkflows) {
-    console.log(chalk.cyan(`  http://${host}:${port}${path}`));
-  }
-  console.log(chalk.gray('\nPress Ctrl+C to stop.\n'));
-
-  // Handle graceful shutdown
-  process.on('SIGINT', async () => {
-    console.log(chalk.yellow('\nShutting down...'));
-    await receiver.stop();
-    process.exit(0);
-  });
-
-  process.on('SIGTERM', async () => {
-    await receiver.stop();
-    process.exit(0);
-  });
+  // Write the startup banner in one call rather than one per endpoint
+  console.log(
+    [
+      chalk.green(`\n✓ Webhook server running on http://${host}:${port}`),
+      chalk.gray('\nEndpoints:'),
+      ...Array.from(webhookWorkflows.keys(), (path) =>
+        chalk.cyan(`  http://${host}:${port}${path}`)
+      ),
+      chalk.gray('\nPress Ctrl+C to stop.\n'),
+    ].join('\n')
+  );
+
+  onShutdown(() => receiver.stop());
 
   // Keep process alive
   await new Promise(() => {});
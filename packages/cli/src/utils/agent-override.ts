@@ -99,10 +99,16 @@ export function debugLogAgentOverride(
   replacedCount: number,
   authConfig: Record<string, string>
 ): void {
-  console.log(chalk.gray('\n🐛 Debug: AI Agent Override'));
-  console.log(chalk.gray(`  Provider: ${agentName} -> ${sdkName}`));
-  console.log(chalk.gray(`  Replaced ${replacedCount} existing AI tool(s)`));
-  console.log(chalk.gray(`  Auth Config: ${JSON.stringify(authConfig, null, 2).split('\n').join('\n  ')}`));
+  console.log(
+    chalk.gray(
+      [
+        '\n🐛 Debug: AI Agent Override',
+        `  Provider: ${agentName} -> ${sdkName}`,
+        `  Replaced ${replacedCount} existing AI tool(s)`,
+        `  Auth Config: ${JSON.stringify(authConfig, null, 2).replaceAll('\n', '\n  ')}`,
+      ].join('\n')
+    )
+  );
 }
 
 export interface ModelOverrideResult {
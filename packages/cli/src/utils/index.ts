@@ -22,3 +22,15 @@ export {
   type AgentOverrideResult,
   type ModelOverrideResult,
 } from './agent-override.js';
+
+export {
+  WORKFLOW_CACHE_PATH,
+  summarizeWorkflows,
+  type WorkflowSummary,
+} from './workflow-cache.js';
+
+export { countByStatus } from './status-counts.js';
+
+export { parseFileCached } from './parse-cache.js';
+
+export { onShutdown } from './shutdown.js';
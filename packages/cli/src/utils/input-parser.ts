@@ -13,14 +13,17 @@ export interface ParseInputsOptions {
 }
 
 /**
- * Parse CLI input pairs into a key-value object
+ * Parse CLI input pairs into a key-value object.
+ * Values may themselves contain '='; pairs without one are ignored.
  */
 export function parseInputPairs(inputPairs: string[] | undefined): Record<string, unknown> {
   const inputs: Record<string, unknown> = {};
   if (inputPairs) {
     for (const pair of inputPairs) {
-      const [key, value] = pair.split('=');
-      inputs[key] = value;
+      const separator = pair.indexOf('=');
+      if (separator !== -1) {
+        inputs[pair.slice(0, separator)] = pair.slice(separator + 1);
+      }
     }
   }
   return inputs;
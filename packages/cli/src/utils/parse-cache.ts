@@ -0,0 +1,50 @@
+/**
+ * Parsed workflow cache for long-running commands (worker, trigger)
+ */
+
+import { stat } from 'node:fs/promises';
+import { resolve } from 'node:path';
+import { parseFile, type ParseResult } from '@marktoflow/core';
+
+/** Most workflow files kept parsed at once */
+const MAX_CACHED_WORKFLOWS = 256;
+
+interface CacheEntry {
+  mtimeMs: number;
+  size: number;
+  result: Promise<ParseResult>;
+}
+
+// Map insertion order doubles as recency order: hits are re-inserted at the
+// end and the first key is the least recently used
+const parsedWorkflows = new Map<string, CacheEntry>();
+
+/**
+ * Parse a workflow file, reusing the previous result while the file's
+ * modification time and size are unchanged. Concurrent calls for the same
+ * file share one parse, and failed parses are not cached.
+ */
+export async function parseFileCached(path: string): Promise<ParseResult> {
+  const key = resolve(path);
+  const stats = await stat(key);
+
+  const cached = parsedWorkflows.get(key);
+  parsedWorkflows.delete(key);
+  if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+    parsedWorkflows.set(key, cached);
+    return cached.result;
+  }
+
+  const result = parseFile(key);
+  parsedWorkflows.set(key, { mtimeMs: stats.mtimeMs, size: stats.size, result });
+  if (parsedWorkflows.size > MAX_CACHED_WORKFLOWS) {
+    parsedWorkflows.delete(parsedWorkflows.keys().next().value!);
+  }
+
+  result.catch(() => {
+    if (parsedWorkflows.get(key)?.result === result) {
+      parsedWorkflows.delete(key);
+    }
+  });
+  return result;
+}
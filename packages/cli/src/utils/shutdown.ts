@@ -0,0 +1,25 @@
+/**
+ * Graceful shutdown for long-running commands (serve, worker)
+ */
+
+import chalk from 'chalk';
+
+/**
+ * Run `stop` once when the process receives SIGINT or SIGTERM, then exit.
+ * Handlers are installed with `once`, so a second Ctrl+C while stopping
+ * falls through to Node's default handler and ends the process at once.
+ */
+export function onShutdown(stop: () => Promise<void> | void): void {
+  let stopping = false;
+  const handler = async (signal: NodeJS.Signals) => {
+    if (stopping) return;
+    stopping = true;
+    if (signal === 'SIGINT') {
+      console.log(chalk.yellow('\nShutting down...'));
+    }
+    await stop();
+    process.exit(0);
+  };
+  process.once('SIGINT', handler);
+  process.once('SIGTERM', handler);
+}
@@ -0,0 +1,15 @@
+/**
+ * Step status tallies for run, debug and dry-run summaries
+ */
+
+/**
+ * Count items by their status in a single pass.
+ * Statuses that never occur are absent, so read counts with `?? 0`.
+ */
+export function countByStatus(items: ReadonlyArray<{ status: string }>): Record<string, number> {
+  const counts: Record<string, number> = {};
+  for (const { status } of items) {
+    counts[status] = (counts[status] ?? 0) + 1;
+  }
+  return counts;
+}
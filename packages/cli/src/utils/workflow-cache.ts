@@ -0,0 +1,132 @@
+/**
+ * Workflow summary cache for `workflow list`
+ */
+
+import {
+  existsSync,
+  mkdirSync,
+  readFileSync,
+  renameSync,
+  rmSync,
+  statSync,
+  writeFileSync,
+} from 'node:fs';
+import { dirname, join, resolve } from 'node:path';
+import { parseFileMetadata } from '@marktoflow/core';
+
+/** Default location of the cache, next to the other workflow state */
+export const WORKFLOW_CACHE_PATH = join('.marktoflow', 'state', 'workflow-list-cache.json');
+
+/**
+ * Format of the cache file. Bump it whenever the shape of a cached entry
+ * changes; a cache written with any other version is ignored and rebuilt.
+ */
+const CACHE_VERSION = 1;
+
+export interface WorkflowSummary {
+  /** Workflow file name within the workflows directory */
+  file: string;
+  /** Workflow display name, or null when the file has no readable frontmatter */
+  name: string | null;
+}
+
+interface CacheEntry {
+  mtimeMs: number;
+  size: number;
+  name: string | null;
+}
+
+interface CacheFile {
+  version: number;
+  entries: Record<string, CacheEntry>;
+}
+
+function readCache(cachePath: string): Record<string, CacheEntry> {
+  if (!existsSync(cachePath)) {
+    return {};
+  }
+  try {
+    const data = JSON.parse(readFileSync(cachePath, 'utf8')) as Partial<CacheFile> | null;
+    if (!data || data.version !== CACHE_VERSION || typeof data.entries !== 'object') {
+      return {};
+    }
+    return data.entries ?? {};
+  } catch {
+    return {};
+  }
+}
+
+function writeCache(cachePath: string, entries: Record<string, CacheEntry>): void {
+  // Write to a temporary file and rename it into place, so a concurrent
+  // reader never sees a partially written cache
+  const tempPath = `${cachePath}.${process.pid}.tmp`;
+  try {
+    mkdirSync(dirname(cachePath), { recursive: true });
+    const data: CacheFile = { version: CACHE_VERSION, entries };
+    writeFileSync(tempPath, JSON.stringify(data));
+    renameSync(tempPath, cachePath);
+  } catch {
+    // The cache is only an optimization; listing works without it, for
+    // example in a read-only checkout. Don't leave a stray temp file behind.
+    try {
+      rmSync(tempPath, { force: true });
+    } catch {
+      // Nothing more to clean up
+    }
+  }
+}
+
+/**
+ * Summarize workflow files, reusing cached results for files whose
+ * modification time and size are unchanged since they were last read.
+ * Only the frontmatter of new or modified files is parsed; the cache is
+ * rewritten when anything changed.
+ */
+export async function summarizeWorkflows(
+  workflowsDir: string,
+  files: string[],
+  cachePath: string = WORKFLOW_CACHE_PATH
+): Promise<WorkflowSummary[]> {
+  const cached = readCache(cachePath);
+  const entries: Record<string, CacheEntry> = {};
+  const summaries: WorkflowSummary[] = [];
+  let changed = false;
+
+  for (const file of files) {
+    const filePath = join(workflowsDir, file);
+    const key = resolve(filePath);
+    const stats = statSync(filePath);
+
+    let entry = cached[key];
+    if (!entry || entry.mtimeMs !== stats.mtimeMs || entry.size !== stats.size) {
+      let name: string | null;
+      try {
+        name = (await parseFileMetadata(filePath)).name;
+      } catch {
+        name = null;
+      }
+      entry = { mtimeMs: stats.mtimeMs, size: stats.size, name };
+      changed = true;
+    }
+
+    entries[key] = entry;
+    summaries.push({ file, name: entry.name });
+  }
+
+  // Entries for files in other directories are kept; only this directory's
+  // removed files are dropped
+  for (const [key, entry] of Object.entries(cached)) {
+    if (key in entries) continue;
+    if (dirname(key) === resolve(workflowsDir)) {
+      changed = true;
+    } else {
+      entries[key] = entry;
+    }
+  }
+
+  if (changed) {
+    writeCache(cachePath, entries);
+  }
+
+  return summaries;
+}
@@ -0,0 +1,5 @@
+/**
+ * marktoflow CLI version
+ */
+
+export const VERSION = '2.0.0-alpha.12';
@@ -20,6 +20,19 @@ describe('CLI', () => {
     expect(output).toContain('marktoflow v2.0.0-alpha.12');
   });
 
+  it('should show version with --version', () => {
+    expect(runCLI('--version').trim()).toBe('2.0.0-alpha.12');
+    expect(runCLI('-V').trim()).toBe('2.0.0-alpha.12');
+  });
+
+  it('should show help', () => {
+    const output = runCLI('--help');
+    expect(output).toContain('Usage: marktoflow');
+    expect(output).toContain('run [options] <workflow>');
+    expect(output).toContain('worker [options]');
+    expect(output).toContain('serve [options]');
+  });
+
   it('should run doctor', () => {
     const output = runCLI('doctor');
     expect(output).toContain('marktoflow Doctor');
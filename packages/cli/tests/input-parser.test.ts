@@ -0,0 +1,17 @@
+import { describe, it, expect } from 'vitest';
+import { parseInputPairs } from '../src/utils/input-parser.js';
+
+describe('parseInputPairs', () => {
+  it('should split each pair at the first equals sign', () => {
+    expect(parseInputPairs(['name=World', 'query=a=b&c=d', 'empty='])).toEqual({
+      name: 'World',
+      query: 'a=b&c=d',
+      empty: '',
+    });
+  });
+
+  it('should ignore pairs without an equals sign', () => {
+    expect(parseInputPairs(['flag', 'key=value'])).toEqual({ key: 'value' });
+    expect(parseInputPairs(undefined)).toEqual({});
+  });
+});
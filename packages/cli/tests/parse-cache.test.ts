@@ -0,0 +1,49 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { mkdirSync, rmSync, writeFileSync, utimesSync } from 'node:fs';
+import { join } from 'node:path';
+import { tmpdir } from 'node:os';
+
+const { parseFile } = vi.hoisted(() => ({ parseFile: vi.fn() }));
+
+vi.mock('@marktoflow/core', () => ({ parseFile }));
+
+import { parseFileCached } from '../src/utils/parse-cache.js';
+
+describe('parseFileCached', () => {
+  let tempDir: string;
+
+  beforeEach(() => {
+    tempDir = join(tmpdir(), `marktoflow-parse-cache-test-${Date.now()}-${Math.random()}`);
+    mkdirSync(tempDir, { recursive: true });
+    parseFile.mockReset();
+    parseFile.mockImplementation(async (path: string) => ({ workflow: { path }, warnings: [] }));
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('should parse a file once until it changes', async () => {
+    const filePath = join(tempDir, 'a.md');
+    writeFileSync(filePath, 'one');
+
+    const [first, second] = await Promise.all([parseFileCached(filePath), parseFileCached(filePath)]);
+    expect(second).toBe(first);
+    expect(await parseFileCached(filePath)).toBe(first);
+    expect(parseFile).toHaveBeenCalledTimes(1);
+
+    utimesSync(filePath, new Date(), new Date(Date.now() + 5000));
+    expect(await parseFileCached(filePath)).not.toBe(first);
+    expect(parseFile).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not cache failed parses', async () => {
+    const filePath = join(tempDir, 'b.md');
+    writeFileSync(filePath, 'two');
+    parseFile.mockRejectedValueOnce(new Error('bad workflow'));
+
+    await expect(parseFileCached(filePath)).rejects.toThrow('bad workflow');
+    await expect(parseFileCached(filePath)).resolves.toBeDefined();
+    expect(parseFile).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,14 @@
+import { describe, it, expect } from 'vitest';
+import { countByStatus } from '../src/utils/status-counts.js';
+
+describe('countByStatus', () => {
+  it('should tally every status in one pass', () => {
+    const counts = countByStatus([
+      { status: 'completed' },
+      { status: 'failed' },
+      { status: 'completed' },
+    ]);
+    expect(counts).toEqual({ completed: 2, failed: 1 });
+    expect(counts['skipped'] ?? 0).toBe(0);
+  });
+});
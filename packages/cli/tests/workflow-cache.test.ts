@@ -0,0 +1,118 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { mkdirSync, rmSync, writeFileSync, readFileSync, existsSync, utimesSync } from 'node:fs';
+import { join } from 'node:path';
+import { tmpdir } from 'node:os';
+
+const { parseFileMetadata } = vi.hoisted(() => ({ parseFileMetadata: vi.fn() }));
+
+vi.mock('@marktoflow/core', () => ({ parseFileMetadata }));
+
+import { summarizeWorkflows } from '../src/utils/workflow-cache.js';
+
+describe('summarizeWorkflows', () => {
+  let tempDir: string;
+  let workflowsDir: string;
+  let cachePath: string;
+
+  beforeEach(() => {
+    tempDir = join(tmpdir(), `marktoflow-cache-test-${Date.now()}-${Math.random()}`);
+    workflowsDir = join(tempDir, 'workflows');
+    cachePath = join(tempDir, 'state', 'workflow-list-cache.json');
+    mkdirSync(workflowsDir, { recursive: true });
+
+    parseFileMetadata.mockReset();
+    parseFileMetadata.mockImplementation(async (path: string) => {
+      const content = readFileSync(path, 'utf8');
+      if (content.startsWith('invalid')) throw new Error('bad workflow');
+      return { id: 'test', name: content.trim(), version: '1.0.0' };
+    });
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('should parse each file once and reuse the cache afterwards', async () => {
+    writeFileSync(join(workflowsDir, 'a.md'), 'Workflow A');
+    writeFileSync(join(workflowsDir, 'b.md'), 'invalid');
+
+    const first = await summarizeWorkflows(workflowsDir, ['a.md', 'b.md'], cachePath);
+    expect(first).toEqual([
+      { file: 'a.md', name: 'Workflow A' },
+      { file: 'b.md', name: null },
+    ]);
+    expect(parseFileMetadata).toHaveBeenCalledTimes(2);
+    expect(existsSync(cachePath)).toBe(true);
+
+    const second = await summarizeWorkflows(workflowsDir, ['a.md', 'b.md'], cachePath);
+    expect(second).toEqual(first);
+    expect(parseFileMetadata).toHaveBeenCalledTimes(2);
+  });
+
+  it('should reparse files whose size or modification time changed', async () => {
+    const filePath = join(workflowsDir, 'a.md');
+    writeFileSync(filePath, 'Workflow A');
+    await summarizeWorkflows(workflowsDir, ['a.md'], cachePath);
+
+    writeFileSync(filePath, 'Renamed workflow');
+    expect(await summarizeWorkflows(workflowsDir, ['a.md'], cachePath)).toEqual([
+      { file: 'a.md', name: 'Renamed workflow' },
+    ]);
+
+    // Same size, newer modification time
+    writeFileSync(filePath, 'Renamed workflox');
+    utimesSync(filePath, new Date(), new Date(Date.now() + 5000));
+    expect(await summarizeWorkflows(workflowsDir, ['a.md'], cachePath)).toEqual([
+      { file: 'a.md', name: 'Renamed workflox' },
+    ]);
+    expect(parseFileMetadata).toHaveBeenCalledTimes(3);
+  });
+
+  it('should drop entries for removed files', async () => {
+    writeFileSync(join(workflowsDir, 'a.md'), 'Workflow A');
+    writeFileSync(join(workflowsDir, 'b.md'), 'Workflow B');
+    await summarizeWorkflows(workflowsDir, ['a.md', 'b.md'], cachePath);
+
+    await summarizeWorkflows(workflowsDir, ['a.md'], cachePath);
+
+    const cache = JSON.parse(readFileSync(cachePath, 'utf8'));
+    expect(Object.keys(cache.entries)).toEqual([join(workflowsDir, 'a.md')]);
+  });
+
+  it('should ignore a corrupt cache file', async () => {
+    mkdirSync(join(tempDir, 'state'), { recursive: true });
+    writeFileSync(cachePath, '{not json');
+    writeFileSync(join(workflowsDir, 'a.md'), 'Workflow A');
+
+    expect(await summarizeWorkflows(workflowsDir, ['a.md'], cachePath)).toEqual([
+      { file: 'a.md', name: 'Workflow A' },
+    ]);
+  });
+
+  it('should treat a cache with another format version as a miss', async () => {
+    const filePath = join(workflowsDir, 'a.md');
+    writeFileSync(filePath, 'Workflow A');
+    await summarizeWorkflows(workflowsDir, ['a.md'], cachePath);
+
+    const cache = JSON.parse(readFileSync(cachePath, 'utf8'));
+    cache.version = 0;
+    cache.entries[filePath].name = 'Stale name';
+    writeFileSync(cachePath, JSON.stringify(cache));
+
+    expect(await summarizeWorkflows(workflowsDir, ['a.md'], cachePath)).toEqual([
+      { file: 'a.md', name: 'Workflow A' },
+    ]);
+    expect(parseFileMetadata).toHaveBeenCalledTimes(2);
+  });
+
+  it('should still list workflows when the cache cannot be written', async () => {
+    // A regular file where the state directory should be makes every write fail
+    writeFileSync(join(tempDir, 'state'), '');
+    writeFileSync(join(workflowsDir, 'a.md'), 'Workflow A');
+
+    expect(await summarizeWorkflows(workflowsDir, ['a.md'], cachePath)).toEqual([
+      { file: 'a.md', name: 'Workflow A' },
+    ]);
+    expect(existsSync(cachePath)).toBe(false);
+  });
+});
@@ -127,9 +127,9 @@ export class BundleToolRegistry extends ToolRegistry {
   }
 
   listTools(): string[] {
-    const tools = new Set(super.listTools());
-    for (const name of this.scriptTools.keys()) tools.add(name);
-    return Array.from(tools).sort();
+    // Script tools are registered as definitions too, so the base listing
+    // already holds each name exactly once
+    return super.listTools().sort();
   }
 
   listScriptTools(): string[] {
@@ -53,6 +53,16 @@ export interface Encryptor {
   generateKey(): string;
 }
 
+/**
+ * Encode bytes as padded URL-safe base64, the alphabet Fernet uses, in one
+ * pass. Decoding needs no helper: Node's base64 decoder accepts the URL-safe
+ * alphabet directly.
+ */
+function toUrlSafeBase64(data: Buffer): string {
+  const encoded = data.toString('base64url');
+  return encoded + '='.repeat((4 - (encoded.length % 4)) % 4);
+}
+
 /**
  * Fernet-compatible encryption using Node's built-in crypto.
  *
@@ -78,9 +88,8 @@ export class FernetEncryptor implements Encryptor {
   }
 
   private decodeKey(key: string): { signingKey: Buffer; encryptionKey: Buffer } {
-    // Handle URL-safe base64
-    const base64 = key.replace(/-/g, '+').replace(/_/g, '/');
-    const keyBuffer = Buffer.from(base64, 'base64');
+    // Handles URL-safe base64 too
+    const keyBuffer = Buffer.from(key, 'base64');
 
     if (keyBuffer.length !== 32) {
       throw new KeyNotFoundError(`Invalid Fernet key length: expected 32 bytes, got ${keyBuffer.length}`);
@@ -129,7 +138,7 @@ export class FernetEncryptor implements Encryptor {
     const token = Buffer.concat([tokenWithoutHmac, hmac]);
 
     // Return URL-safe base64
-    return token.toString('base64').replace(/\+/g, '-').replace(/\//g, '_');
+    return toUrlSafeBase64(token);
   }
 
   decrypt(ciphertext: string): string {
@@ -139,8 +148,7 @@ export class FernetEncryptor implements Encryptor {
 
     try {
       // Decode URL-safe base64
-      const base64 = ciphertext.replace(/-/g, '+').replace(/_/g, '/');
-      const token = Buffer.from(base64, 'base64');
+      const token = Buffer.from(ciphertext, 'base64');
 
       if (token.length < 57) {
         // 1 + 8 + 16 + 16 (min ciphertext) + 32 (hmac) = 73, but can be less with small plaintext
@@ -193,7 +201,7 @@ export class FernetEncryptor implements Encryptor {
   generateKey(): string {
     // Generate 32 random bytes and encode as URL-safe base64
     const key = randomBytes(32);
-    return key.toString('base64').replace(/\+/g, '-').replace(/\//g, '_');
+    return toUrlSafeBase64(key);
   }
 }
 
@@ -15,6 +15,8 @@ import {
   WorkflowStatus,
   createExecutionContext,
   createStepResult,
+  startTimer,
+  elapsedSince,
   isActionStep,
   isSubWorkflowStep,
   isIfStep,
@@ -40,6 +42,7 @@ import {
   type ActionStep,
   type SubWorkflowStep,
   type Permissions,
+  type Timer,
 } from './models.js';
 import {
   mergePermissions,
@@ -250,28 +253,42 @@ export class CircuitBreaker {
  * - Jinja2-style control flow ({% for %}, {% if %}, etc.)
  */
 export function resolveTemplates(value: unknown, context: ExecutionContext): unknown {
-  if (typeof value === 'string') {
-    // Build the template context with all available variables
-    // Spread inputs first, then variables (variables override inputs if same key)
-    // Also keep inputs accessible via inputs.* for explicit access
-    const templateContext: Record<string, unknown> = {
-      ...context.inputs, // Spread inputs at root level for direct access ({{ path }})
-      ...context.variables, // Variables override inputs if same key
-      inputs: context.inputs, // Also keep inputs accessible as inputs.*
-    };
+  // The template context is built lazily, once per call, and shared by every
+  // string in the value instead of being rebuilt for each one
+  let templateContext: Record<string, unknown> | undefined;
+  const getTemplateContext = (): Record<string, unknown> => {
+    if (!templateContext) {
+      // Spread inputs first, then variables (variables override inputs if same key)
+      // Also keep inputs accessible via inputs.* for explicit access
+      templateContext = {
+        ...context.inputs, // Spread inputs at root level for direct access ({{ path }})
+        ...context.variables, // Variables override inputs if same key
+        inputs: context.inputs, // Also keep inputs accessible as inputs.*
+      };
+    }
+    return templateContext;
+  };
 
+  return resolveTemplateValue(value, getTemplateContext);
+}
+
+function resolveTemplateValue(
+  value: unknown,
+  getTemplateContext: () => Record<string, unknown>
+): unknown {
+  if (typeof value === 'string') {
     // Use the new Nunjucks-based template engine with legacy syntax support
-    return renderTemplate(value, templateContext);
+    return renderTemplate(value, getTemplateContext());
   }
 
   if (Array.isArray(value)) {
-    return value.map((v) => resolveTemplates(v, context));
+    return value.map((v) => resolveTemplateValue(v, getTemplateContext));
   }
 
   if (value && typeof value === 'object') {
     const result: Record<string, unknown> = {};
     for (const [k, v] of Object.entries(value)) {
-      result[k] = resolveTemplates(v, context);
+      result[k] = resolveTemplateValue(v, getTemplateContext);
     }
     return result;
   }
@@ -380,6 +397,9 @@ function getNestedValue(obj: unknown, path: string): unknown {
 // Engine Implementation
 // ============================================================================
 
+// Fenced JSON block in sub-agent responses
+const JSON_BLOCK_PATTERN = /```json\n?([\s\S]*?)```/;
+
 interface InternalEngineConfig {
   defaultTimeout: number;
   maxRetries: number;
@@ -496,7 +516,7 @@ export class WorkflowEngine {
   ): Promise<WorkflowResult> {
     const context = createExecutionContext(workflow, inputs);
     const stepResults: StepResult[] = [];
-    const startedAt = new Date();
+    const timer = startTimer();
 
     // Store workflow-level permissions and defaults
     this.workflowPermissions = workflow.permissions;
@@ -518,7 +538,7 @@ export class WorkflowEngine {
         workflowId: workflow.metadata.id,
         workflowPath: 'unknown',
         status: WorkflowStatus.RUNNING,
-        startedAt: startedAt,
+        startedAt: timer.startedAt,
         completedAt: null,
         currentStep: 0,
         totalSteps: workflow.steps.length,
@@ -576,7 +596,7 @@ export class WorkflowEngine {
               workflow,
               context,
               stepResults,
-              startedAt,
+              timer,
               workflowError
             );
             this.events.onWorkflowComplete?.(workflow, workflowResult);
@@ -597,7 +617,7 @@ export class WorkflowEngine {
               workflow,
               context,
               stepResults,
-              startedAt,
+              timer,
               workflowError
             );
             this.events.onWorkflowComplete?.(workflow, workflowResult);
@@ -623,7 +643,7 @@ export class WorkflowEngine {
         workflow,
         context,
         stepResults,
-        startedAt,
+        timer,
         error instanceof Error ? error.message : String(error)
       );
 
@@ -631,7 +651,7 @@ export class WorkflowEngine {
       return workflowResult;
     }
 
-    const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, startedAt);
+    const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, timer);
 
     if (this.stateStore) {
       this.stateStore.updateExecution(context.runId, {
@@ -879,7 +899,7 @@ ${workflowContent}
 
 ## Inputs
 \`\`\`json
-${JSON.stringify(inputs, null, 2)}
+${JSON.stringify(inputs)}
 \`\`\`
 
 ## Available Tools
@@ -935,7 +955,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     }
 
     // Try to parse JSON from the response
-    const jsonMatch = content.match(/```json\n?([\s\S]*?)```/);
+    const jsonMatch = content.match(JSON_BLOCK_PATTERN);
     if (jsonMatch) {
       try {
         const parsed = JSON.parse(jsonMatch[1]) as Record<string, unknown>;
@@ -1065,7 +1085,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
     let lastError: Error | undefined;
 
     // Build executor context with model/agent/permissions
@@ -1081,19 +1101,12 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
             () => this.executeSubWorkflowWithAgent(step, context, sdkRegistry, stepExecutor),
             step.timeout ?? this.config.defaultTimeout
           );
-          const result = createStepResult(step.id, StepStatus.COMPLETED, output, startedAt, 0);
+          const result = createStepResult(step.id, StepStatus.COMPLETED, output, timer, 0);
           this.events.onStepComplete?.(step, result);
           return result;
         } catch (error) {
           lastError = error instanceof Error ? error : new Error(String(error));
-          const result = createStepResult(
-            step.id,
-            StepStatus.FAILED,
-            null,
-            startedAt,
-            0,
-            lastError
-          );
+          const result = createStepResult(step.id, StepStatus.FAILED, null, timer, 0, lastError);
           this.events.onStepComplete?.(step, result);
           return result;
         }
@@ -1106,7 +1119,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           () => this.executeSubWorkflow(step, context, sdkRegistry, stepExecutor),
           step.timeout ?? this.config.defaultTimeout
         );
-        const result = createStepResult(step.id, StepStatus.COMPLETED, output, startedAt, 0);
+        const result = createStepResult(step.id, StepStatus.COMPLETED, output, timer, 0);
         this.events.onStepComplete?.(step, result);
         return result;
       } catch (error) {
@@ -1115,7 +1128,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           lastError // Pass full error object
         );
@@ -1130,7 +1143,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         'Step is neither an action nor a workflow'
       );
@@ -1153,7 +1166,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           attempt,
           `Circuit breaker open for service: ${serviceName}`
         );
@@ -1191,7 +1204,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
 
         circuitBreaker.recordSuccess();
 
-        const result = createStepResult(step.id, StepStatus.COMPLETED, output, startedAt, attempt);
+        const result = createStepResult(step.id, StepStatus.COMPLETED, output, timer, attempt);
         this.events.onStepComplete?.(step, result);
         return result;
       } catch (error) {
@@ -1212,7 +1225,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       step.id,
       StepStatus.FAILED,
       null,
-      startedAt,
+      timer,
       maxRetries,
       lastError // Pass full error object to preserve HTTP details, stack traces, etc.
     );
@@ -1424,7 +1437,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     workflow: Workflow,
     context: ExecutionContext,
     stepResults: StepResult[],
-    startedAt: Date,
+    timer: Timer,
     error?: string
   ): WorkflowResult {
     const completedAt = new Date();
@@ -1439,9 +1452,9 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       stepResults,
       output,
       error,
-      startedAt,
+      startedAt: timer.startedAt,
       completedAt,
-      duration: completedAt.getTime() - startedAt.getTime(),
+      duration: elapsedSince(timer.t0),
     };
   }
 
@@ -1467,7 +1480,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Evaluate condition
@@ -1479,7 +1492,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         : step.else;
 
       if (!branchSteps || branchSteps.length === 0) {
-        return createStepResult(step.id, StepStatus.SKIPPED, null, startedAt);
+        return createStepResult(step.id, StepStatus.SKIPPED, null, timer);
       }
 
       // Execute the branch steps
@@ -1493,17 +1506,17 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         }
 
         if (result.status === StepStatus.FAILED) {
-          return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, result.error);
+          return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, result.error);
         }
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, branchResults, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, branchResults, timer);
     } catch (error) {
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1519,7 +1532,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve the switch expression
@@ -1531,7 +1544,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       const caseSteps = step.cases[expressionValue] || step.default;
 
       if (!caseSteps || caseSteps.length === 0) {
-        return createStepResult(step.id, StepStatus.SKIPPED, null, startedAt);
+        return createStepResult(step.id, StepStatus.SKIPPED, null, timer);
       }
 
       // Execute case steps
@@ -1545,17 +1558,17 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         }
 
         if (result.status === StepStatus.FAILED) {
-          return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, result.error);
+          return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, result.error);
         }
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, caseResults, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, caseResults, timer);
     } catch (error) {
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1571,7 +1584,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve items array
@@ -1582,14 +1595,14 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           'Items must be an array'
         );
       }
 
       if (items.length === 0) {
-        return createStepResult(step.id, StepStatus.SKIPPED, [], startedAt);
+        return createStepResult(step.id, StepStatus.SKIPPED, [], timer);
       }
 
       // Execute steps for each item
@@ -1623,7 +1636,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
               delete context.variables[step.itemVariable];
               delete context.variables['loop'];
               if (step.indexVariable) delete context.variables[step.indexVariable];
-              return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, result.error);
+              return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, result.error);
             }
             // 'continue' - skip to next iteration
             break;
@@ -1638,7 +1651,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       delete context.variables['loop'];
       if (step.indexVariable) delete context.variables[step.indexVariable];
 
-      return createStepResult(step.id, StepStatus.COMPLETED, results, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, results, timer);
     } catch (error) {
       // Clean up loop variables on error
       delete context.variables[step.itemVariable];
@@ -1649,7 +1662,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1665,7 +1678,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
     let iterations = 0;
 
     try {
@@ -1675,7 +1688,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
             step.id,
             StepStatus.FAILED,
             null,
-            startedAt,
+            timer,
             0,
             `Max iterations (${step.maxIterations}) exceeded`
           );
@@ -1692,7 +1705,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           if (result.status === StepStatus.FAILED) {
             const errorAction = step.errorHandling?.action ?? 'stop';
             if (errorAction === 'stop') {
-              return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, result.error);
+              return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, result.error);
             }
             // 'continue' - skip to next iteration
             break;
@@ -1702,13 +1715,13 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         iterations++;
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, { iterations }, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, { iterations }, timer);
     } catch (error) {
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1724,7 +1737,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     _sdkRegistry: SDKRegistryLike,
     _stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve items array
@@ -1735,7 +1748,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           'Items must be an array'
         );
@@ -1749,14 +1762,14 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         return result;
       });
 
-      return createStepResult(step.id, StepStatus.COMPLETED, mapped, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, mapped, timer);
     } catch (error) {
       delete context.variables[step.itemVariable];
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1772,7 +1785,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     _sdkRegistry: SDKRegistryLike,
     _stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve items array
@@ -1783,7 +1796,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           'Items must be an array'
         );
@@ -1797,14 +1810,14 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         return result;
       });
 
-      return createStepResult(step.id, StepStatus.COMPLETED, filtered, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, filtered, timer);
     } catch (error) {
       delete context.variables[step.itemVariable];
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1820,7 +1833,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     _sdkRegistry: SDKRegistryLike,
     _stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve items array
@@ -1831,7 +1844,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           'Items must be an array'
         );
@@ -1848,7 +1861,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         delete context.variables[step.accumulatorVariable];
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, accumulator, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, accumulator, timer);
     } catch (error) {
       delete context.variables[step.itemVariable];
       delete context.variables[step.accumulatorVariable];
@@ -1856,7 +1869,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1872,7 +1885,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Execute branches in parallel
@@ -1909,16 +1922,16 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       }
 
       const outputs = branchResults.map((br) => br.results);
-      return createStepResult(step.id, StepStatus.COMPLETED, outputs, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, outputs, timer);
     } catch (error) {
       if (step.onError === 'continue') {
-        return createStepResult(step.id, StepStatus.COMPLETED, null, startedAt);
+        return createStepResult(step.id, StepStatus.COMPLETED, null, timer);
       }
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -1934,7 +1947,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
     let tryError: Error | undefined;
 
     try {
@@ -1991,15 +2004,15 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
       // Return success if catch handled the error, or error if not
       if (tryError && !step.catch) {
         // No catch block to handle error
-        return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, tryError.message);
+        return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, tryError.message);
       }
 
       if (catchError) {
         // Catch block also failed
-        return createStepResult(step.id, StepStatus.FAILED, null, startedAt, 0, catchError.message);
+        return createStepResult(step.id, StepStatus.FAILED, null, timer, 0, catchError.message);
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, null, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, null, timer);
     } catch (error) {
       // Execute finally even on unexpected error
       if (step.finally) {
@@ -2020,7 +2033,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
@@ -2034,7 +2047,7 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
     step: ScriptStep,
     context: ExecutionContext
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const timer = startTimer();
 
     try {
       // Resolve any templates in the code
@@ -2061,19 +2074,19 @@ Execute the workflow steps in order and return the final outputs as JSON.`;
           step.id,
           StepStatus.FAILED,
           null,
-          startedAt,
+          timer,
           0,
           result.error ?? 'Script execution failed'
         );
       }
 
-      return createStepResult(step.id, StepStatus.COMPLETED, result.value, startedAt);
+      return createStepResult(step.id, StepStatus.COMPLETED, result.value, timer);
     } catch (error) {
       return createStepResult(
         step.id,
         StepStatus.FAILED,
         null,
-        startedAt,
+        timer,
         0,
         error instanceof Error ? error.message : String(error)
       );
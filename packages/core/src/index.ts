@@ -81,6 +81,8 @@ export {
 export {
   parseFile,
   parseContent,
+  parseFileMetadata,
+  parseMetadata,
   extractVariableReferences,
   validateVariableReferences,
   ParseError,
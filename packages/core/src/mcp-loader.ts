@@ -4,10 +4,8 @@
  * Handles loading and connection to MCP servers (both native/in-memory and stdio).
  */
 
-import { Client } from "@modelcontextprotocol/sdk/client/index.js";
-import { InMemoryTransport } from "@modelcontextprotocol/sdk/inMemory.js";
-import { StdioClientTransport } from "@modelcontextprotocol/sdk/client/stdio.js";
-import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
+import type { Client } from "@modelcontextprotocol/sdk/client/index.js";
+import type { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { ToolConfig } from "./models.js";
 
 // Interface for Native MCP Modules
@@ -35,7 +33,13 @@ export class McpLoader {
 
     // Create the server instance
     const server: McpServer = await module.createMcpServer(config.options || {});
-    
+
+    // The MCP SDK is loaded only once a server is actually connected
+    const [{ Client }, { InMemoryTransport }] = await Promise.all([
+      import("@modelcontextprotocol/sdk/client/index.js"),
+      import("@modelcontextprotocol/sdk/inMemory.js"),
+    ]);
+
     // Create linked in-memory transports
     const [clientTransport, serverTransport] = InMemoryTransport.createLinkedPair();
 
@@ -71,6 +75,10 @@ export class McpLoader {
    * Connect to an external MCP server via Stdio.
    */
   async connectStdio(command: string, args: string[]): Promise<Client> {
+    const [{ Client }, { StdioClientTransport }] = await Promise.all([
+      import("@modelcontextprotocol/sdk/client/index.js"),
+      import("@modelcontextprotocol/sdk/client/stdio.js"),
+    ]);
     const transport = new StdioClientTransport({
       command,
       args,
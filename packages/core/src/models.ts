@@ -466,15 +466,37 @@ export function createExecutionContext(
   };
 }
 
+/**
+ * Start time of a step or workflow: the wall-clock timestamp that is
+ * reported, plus a monotonic clock reading that durations are measured from,
+ * so they can't go negative or jump when the system clock is adjusted.
+ */
+export interface Timer {
+  startedAt: Date;
+  t0: number;
+}
+
+export function startTimer(): Timer {
+  return { startedAt: new Date(), t0: performance.now() };
+}
+
+/**
+ * Milliseconds between two monotonic clock readings.
+ */
+export function elapsedSince(t0: number, t1: number = performance.now()): number {
+  return Math.round(t1 - t0);
+}
+
 export function createStepResult(
   stepId: string,
   status: StepStatus,
   output: unknown,
-  startedAt: Date,
+  started: Date | Timer,
   retryCount = 0,
   error?: unknown
 ): StepResult {
   const completedAt = new Date();
+  const startedAt = started instanceof Date ? started : started.startedAt;
   return {
     stepId,
     status,
@@ -482,7 +504,10 @@ export function createStepResult(
     error,
     startedAt,
     completedAt,
-    duration: completedAt.getTime() - startedAt.getTime(),
+    duration:
+      started instanceof Date
+        ? completedAt.getTime() - started.getTime()
+        : elapsedSince(started.t0),
     retryCount,
   };
 }
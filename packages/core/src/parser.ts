@@ -15,6 +15,7 @@ import {
   ToolConfig,
   ToolConfigSchema,
   Trigger,
+  WorkflowMetadata,
 } from './models.js';
 
 // ============================================================================
@@ -50,6 +51,8 @@ export class ParseError extends Error {
 
 const FRONTMATTER_REGEX = /^---\n([\s\S]*?)\n---/;
 const STEP_CODE_BLOCK_REGEX = /```ya?ml\n([\s\S]*?)```/g;
+const ENV_VAR_REGEX = /\$\{([^}]+)\}/g;
+const VARIABLE_REFERENCE_REGEX = /\{\{([^}]+)\}\}/g;
 
 /**
  * Parse a workflow from a markdown file.
@@ -66,23 +69,7 @@ export function parseContent(content: string, options: ParseOptions = {}): Parse
   const { validate = true, resolveEnv = true } = options;
   const warnings: string[] = [];
 
-  // Extract frontmatter
-  const frontmatterMatch = content.match(FRONTMATTER_REGEX);
-  if (!frontmatterMatch) {
-    throw new ParseError('No YAML frontmatter found. Workflow must start with ---');
-  }
-
-  const frontmatterYaml = frontmatterMatch[1];
-  let frontmatter: Record<string, unknown>;
-
-  try {
-    frontmatter = parseYaml(frontmatterYaml) as Record<string, unknown>;
-  } catch (error) {
-    throw new ParseError('Invalid YAML in frontmatter', undefined, error);
-  }
-
-  // Extract markdown body (after frontmatter)
-  const markdownBody = content.slice(frontmatterMatch[0].length).trim();
+  const { frontmatter, markdownBody } = parseFrontmatter(content);
 
   // Parse workflow structure
   const workflow = buildWorkflow(frontmatter, markdownBody, warnings);
@@ -105,16 +92,55 @@ export function parseContent(content: string, options: ParseOptions = {}): Parse
 }
 
 /**
- * Build a Workflow object from parsed frontmatter and markdown body.
+ * Read only a workflow's metadata from a markdown file.
  */
-function buildWorkflow(
-  frontmatter: Record<string, unknown>,
-  markdownBody: string,
-  warnings: string[]
-): Workflow {
-  // Extract metadata
+export async function parseFileMetadata(path: string): Promise<WorkflowMetadata> {
+  const content = await readFile(path, 'utf-8');
+  return parseMetadata(content);
+}
+
+/**
+ * Read only a workflow's metadata from markdown content.
+ * Tools, inputs and steps are not built or validated, which makes this much
+ * cheaper than parseContent when only names and ids are needed.
+ */
+export function parseMetadata(content: string): WorkflowMetadata {
+  return buildMetadata(parseFrontmatter(content).frontmatter);
+}
+
+/**
+ * Split markdown content into its parsed YAML frontmatter and the body after it.
+ */
+function parseFrontmatter(content: string): {
+  frontmatter: Record<string, unknown>;
+  markdownBody: string;
+} {
+  const frontmatterMatch = content.match(FRONTMATTER_REGEX);
+  if (!frontmatterMatch) {
+    throw new ParseError('No YAML frontmatter found. Workflow must start with ---');
+  }
+
+  const frontmatterYaml = frontmatterMatch[1];
+  let frontmatter: Record<string, unknown>;
+
+  try {
+    frontmatter = parseYaml(frontmatterYaml) as Record<string, unknown>;
+  } catch (error) {
+    throw new ParseError('Invalid YAML in frontmatter', undefined, error);
+  }
+
+  // Extract markdown body (after frontmatter)
+  const markdownBody = content.slice(frontmatterMatch[0].length).trim();
+
+  return { frontmatter, markdownBody };
+}
+
+/**
+ * Build workflow metadata from parsed frontmatter, applying defaults.
+ */
+function buildMetadata(frontmatter: Record<string, unknown>): WorkflowMetadata {
   const workflowMeta = (frontmatter.workflow as Record<string, unknown>) || {};
-  const metadata = {
+  return {
     id: (workflowMeta.id as string) || 'unnamed',
     name: (workflowMeta.name as string) || 'Unnamed Workflow',
     version: (workflowMeta.version as string) || '1.0.0',
@@ -122,6 +148,18 @@ function buildWorkflow(
     author: workflowMeta.author as string | undefined,
     tags: workflowMeta.tags as string[] | undefined,
   };
+}
+
+/**
+ * Build a Workflow object from parsed frontmatter and markdown body.
+ */
+function buildWorkflow(
+  frontmatter: Record<string, unknown>,
+  markdownBody: string,
+  warnings: string[]
+): Workflow {
+  // Extract metadata
+  const metadata = buildMetadata(frontmatter);
 
   // Extract tools
   const toolsRaw = (frontmatter.tools as Record<string, unknown>) || {};
@@ -561,7 +599,7 @@ function normalizeErrorHandling(raw: unknown): Record<string, unknown> | undefin
 function resolveEnvironmentVariables(workflow: Workflow): void {
   const resolve = (value: unknown): unknown => {
     if (typeof value === 'string') {
-      return value.replace(/\$\{([^}]+)\}/g, (_, varName) => {
+      return value.replace(ENV_VAR_REGEX, (_, varName) => {
         return process.env[varName] || '';
       });
     }
@@ -603,11 +641,12 @@ function resolveEnvironmentVariables(workflow: Workflow): void {
  * Returns list of variable names like ["var1", "var2"].
  */
 export function extractVariableReferences(template: string): string[] {
-  const varRegex = /\{\{([^}]+)\}\}/g;
   const matches: string[] = [];
   let match;
 
-  while ((match = varRegex.exec(template)) !== null) {
+  // The shared regex is global; exec() resets lastIndex to 0 once it runs
+  // out of matches, so each call starts from the beginning
+  while ((match = VARIABLE_REFERENCE_REGEX.exec(template)) !== null) {
     matches.push(match[1].trim());
   }
 
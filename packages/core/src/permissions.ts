@@ -6,7 +6,7 @@
  */
 
 import { Permissions } from './models.js';
-import { minimatch } from 'minimatch';
+import { Minimatch } from 'minimatch';
 
 // ============================================================================
 // Types
@@ -301,11 +301,24 @@ function checkNetworkPermission(
 // Pattern Matching Helpers
 // ============================================================================
 
+/** Most compiled glob patterns kept at once */
+const MAX_GLOB_MATCHERS = 256;
+
+// Compiled matchers keyed by pattern. A workflow checks the same few
+// patterns on every file operation, so each is parsed only once.
+const globMatchers = new Map<string, Minimatch>();
+
 /**
  * Match a path against a glob pattern.
  */
 function matchPath(path: string, pattern: string): boolean {
-  return minimatch(path, pattern, { dot: true });
+  let matcher = globMatchers.get(pattern);
+  if (!matcher) {
+    if (globMatchers.size >= MAX_GLOB_MATCHERS) globMatchers.clear();
+    matcher = new Minimatch(pattern, { dot: true });
+    globMatchers.set(pattern, matcher);
+  }
+  return matcher.match(path);
 }
 
 /**
@@ -5,8 +5,7 @@
  */
 
 import { EventEmitter } from 'node:events';
-import { Redis } from 'ioredis';
-import * as amqp from 'amqplib';
+import type { Redis } from 'ioredis';
 import { randomUUID } from 'node:crypto';
 
 // ============================================================================
@@ -205,7 +204,10 @@ export class RedisQueue extends MessageQueue {
   }
 
   async connect(): Promise<void> {
-    this.client = new Redis(this.redisUrl);
+    // Broker clients are loaded on first connect, so importing core does not
+    // load every queue library
+    const { Redis: RedisClient } = await import('ioredis');
+    this.client = new RedisClient(this.redisUrl);
   }
 
   async disconnect(): Promise<void> {
@@ -328,6 +330,7 @@ export class RabbitMQQueue extends MessageQueue {
   }
 
   async connect(): Promise<void> {
+    const amqp = await import('amqplib');
     this.connection = await amqp.connect(this.amqpUrl);
     this.channel = await this.connection.createChannel();
     
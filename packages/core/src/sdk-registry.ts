@@ -7,7 +7,7 @@
 
 import { ToolConfig } from './models.js';
 import { McpLoader } from './mcp-loader.js';
-import { Client } from '@modelcontextprotocol/sdk/client/index.js';
+import type { Client } from '@modelcontextprotocol/sdk/client/index.js';
 
 // ============================================================================
 // Types
@@ -275,6 +275,9 @@ export class SDKRegistry {
   }
 
   private createMcpProxy(client: Client): unknown {
+    // One caller per tool name, so repeated steps reuse the same function
+    const toolCallers = new Map<string, (args: Record<string, unknown>) => Promise<unknown>>();
+
     return new Proxy(client, {
       get: (target, prop) => {
         if (typeof prop === 'string') {
@@ -289,17 +292,22 @@ export class SDKRegistry {
           }
 
           // Otherwise, treat as tool name
-          return async (args: Record<string, unknown>) => {
-            const result = await client.callTool({
-              name: prop,
-              arguments: args,
-            });
-
-            // If tool call fails, it throws? No, Client.callTool throws on error.
-            // Result content handling?
-            // For now return result.
-            return result;
-          };
+          let caller = toolCallers.get(prop);
+          if (!caller) {
+            caller = async (args: Record<string, unknown>) => {
+              const result = await client.callTool({
+                name: prop,
+                arguments: args,
+              });
+
+              // If tool call fails, it throws? No, Client.callTool throws on error.
+              // Result content handling?
+              // For now return result.
+              return result;
+            };
+            toolCallers.set(prop, caller);
+          }
+          return caller;
         }
         return Reflect.get(target, prop);
       },
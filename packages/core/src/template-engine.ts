@@ -32,6 +32,24 @@ const env = new nunjucks.Environment(null, {
 // Register all custom filters
 registerFilters(env);
 
+// Compiled templates keyed by source. Workflow steps render the same template
+// strings on every run, so each is parsed and compiled once. The cache is
+// bounded, evicting the oldest entry once full.
+const MAX_COMPILED_TEMPLATES = 500;
+const compiledTemplates = new Map<string, nunjucks.Template>();
+
+function getCompiledTemplate(template: string): nunjucks.Template {
+  let compiled = compiledTemplates.get(template);
+  if (!compiled) {
+    compiled = new nunjucks.Template(template, env, undefined, true);
+    if (compiledTemplates.size >= MAX_COMPILED_TEMPLATES) {
+      compiledTemplates.delete(compiledTemplates.keys().next().value as string);
+    }
+    compiledTemplates.set(template, compiled);
+  }
+  return compiled;
+}
+
 // ============================================================================
 // Template Resolution
 // ============================================================================
@@ -102,9 +120,14 @@ export function renderTemplate(
     }
   }
 
-  // String with multiple expressions, control flow, or plain text - render as string
+  // Plain text has no template syntax to render
+  if (!template.includes('{')) {
+    return template;
+  }
+
+  // String with multiple expressions or control flow - render as string
   try {
-    return env.renderString(template, context);
+    return getCompiledTemplate(template).render(context);
   } catch (error) {
     // If rendering fails, return the original template
     console.error('Template render error:', error);
@@ -20,6 +20,9 @@ export enum TemplateCategory {
   GENERAL = 'general',
 }
 
+// Category values, collected once for checking template frontmatter
+const TEMPLATE_CATEGORIES: ReadonlySet<string> = new Set(Object.values(TemplateCategory));
+
 export interface TemplateVariable {
   name: string;
   description: string;
@@ -169,6 +172,11 @@ export class WorkflowTemplate {
       if (parts.length >= 3) {
         const frontmatter = parse(parts[1]) as Record<string, any>;
         const templateMeta = frontmatter?.template ?? {};
+        // Custom categories are kept as written so user templates can still be
+        // listed and grouped by them; only flag values outside the enum
+        if (templateMeta.category != null && !TEMPLATE_CATEGORIES.has(templateMeta.category)) {
+          console.warn(`Template ${path} uses unknown category '${templateMeta.category}'`);
+        }
         const metadata: TemplateMetadata = {
           id: templateMeta.id ?? path.split('/').pop()?.replace(/\\.md$/, '') ?? 'template',
           name: templateMeta.name ?? path.split('/').pop()?.replace(/\\.md$/, '') ?? 'Template',
@@ -192,6 +200,9 @@ export class WorkflowTemplate {
   }
 }
 
+// Same ordering as String#localeCompare, without building a collator per comparison
+const NAME_COLLATOR = new Intl.Collator();
+
 export class TemplateRegistry {
   private templates = new Map<string, WorkflowTemplate>();
 
@@ -216,14 +227,18 @@ export class TemplateRegistry {
   }
 
   list(category?: TemplateCategory, tags?: string[]): WorkflowTemplate[] {
-    let items = Array.from(this.templates.values());
-    if (category) {
-      items = items.filter((t) => t.category === category);
-    }
-    if (tags && tags.length > 0) {
-      items = items.filter((t) => (t.metadata.tags ?? []).some((tag) => tags.includes(tag)));
+    // Filter in one pass, with the wanted tags as a set rather than
+    // rescanning the tag list for every template tag
+    const wantedTags = tags && tags.length > 0 ? new Set(tags) : null;
+    const items: WorkflowTemplate[] = [];
+    for (const template of this.templates.values()) {
+      if (category && template.category !== category) continue;
+      if (wantedTags && !(template.metadata.tags ?? []).some((tag) => wantedTags.has(tag))) {
+        continue;
+      }
+      items.push(template);
     }
-    return items.sort((a, b) => a.name.localeCompare(b.name));
+    return items.sort((a, b) => NAME_COLLATOR.compare(a.name, b.name));
   }
 
   search(query: string): WorkflowTemplate[] {
@@ -15,7 +15,7 @@ type McpToolSpec = {
 };
 
 export class MCPTool extends Tool {
-  private operations: Record<string, McpToolSpec> = {};
+  private operations = new Map<string, McpToolSpec>();
   private client: any = null;
   private loader = new McpLoader();
 
@@ -31,11 +31,11 @@ export class MCPTool extends Tool {
       const tools = await (client as any).listTools?.();
       if (Array.isArray(tools)) {
         for (const tool of tools) {
-          this.operations[tool.name] = {
+          this.operations.set(tool.name, {
             name: tool.name,
             description: tool.description,
             input_schema: tool.inputSchema ?? tool.input_schema ?? {},
-          };
+          });
         }
       }
       this.client = client;
@@ -43,7 +43,7 @@ export class MCPTool extends Tool {
       const content = readFileSync(this.implementation.specPath, 'utf8');
       const data = parse(content) as { tools?: McpToolSpec[] };
       for (const tool of data.tools ?? []) {
-        this.operations[tool.name] = tool;
+        this.operations.set(tool.name, tool);
       }
     }
     this.initialized = true;
@@ -51,7 +51,7 @@ export class MCPTool extends Tool {
 
   async execute(operation: string, params: Record<string, unknown>): Promise<unknown> {
     if (!this.initialized) await this.initialize();
-    if (!this.operations[operation]) {
+    if (!this.operations.has(operation)) {
       throw new Error(`Unknown MCP operation: ${operation}`);
     }
     if (!this.client) {
@@ -64,11 +64,11 @@ export class MCPTool extends Tool {
   }
 
   listOperations(): string[] {
-    return Object.keys(this.operations);
+    return Array.from(this.operations.keys());
   }
 
   getOperationSchema(operation: string): Record<string, unknown> {
-    const op = this.operations[operation];
+    const op = this.operations.get(operation);
     if (!op) return {};
     return {
       description: op.description ?? '',
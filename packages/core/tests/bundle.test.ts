@@ -30,5 +30,6 @@ describe('WorkflowBundle', () => {
     expect(workflow.tools).toBeDefined();
     expect(workflow.tools?.echo).toBeDefined();
     expect(workflow.tools?.echo.sdk).toBe('script');
+    expect(bundle.loadTools().listTools()).toEqual(['echo']);
   });
 });
@@ -1,6 +1,14 @@
 import { describe, it, expect, vi } from 'vitest';
 import { WorkflowEngine, RetryPolicy, CircuitBreaker, resolveTemplates } from '../src/engine.js';
-import { Workflow, WorkflowStatus, StepStatus, ExecutionContext } from '../src/models.js';
+import {
+  Workflow,
+  WorkflowStatus,
+  StepStatus,
+  ExecutionContext,
+  createStepResult,
+  startTimer,
+  elapsedSince,
+} from '../src/models.js';
 import { SDKRegistry } from '../src/sdk-registry.js';
 
 describe('RetryPolicy', () => {
@@ -77,6 +85,31 @@ describe('CircuitBreaker', () => {
   });
 });
 
+describe('step timing', () => {
+  it('should measure durations monotonically for timer starts', () => {
+    // Simulate the wall clock being set back after the step started
+    const timer = { ...startTimer(), startedAt: new Date(Date.now() + 60_000) };
+
+    const result = createStepResult('step', StepStatus.COMPLETED, null, timer);
+
+    expect(result.startedAt).toBe(timer.startedAt);
+    expect(result.duration).toBeGreaterThanOrEqual(0);
+    expect(result.duration).toBeLessThan(1000);
+  });
+
+  it('should compute elapsed time from the readings passed in', () => {
+    expect(elapsedSince(100, 350.4)).toBe(250);
+  });
+
+  it('should fall back to wall-clock difference for plain dates', () => {
+    const startedAt = new Date(Date.now() - 250);
+
+    const result = createStepResult('step', StepStatus.COMPLETED, null, startedAt);
+
+    expect(result.duration).toBeGreaterThanOrEqual(250);
+  });
+});
+
 describe('resolveTemplates', () => {
   const context: ExecutionContext = {
     workflowId: 'test',
@@ -39,4 +39,19 @@ describe('MCPTool', () => {
     const schema = tool.getOperationSchema('echo') as any;
     expect(schema.parameters.type).toBe('object');
   });
+
+  it('rejects operations missing from the spec, including prototype keys', async () => {
+    const dir = mkdtempSync(join(tmpdir(), 'mcp-tool-'));
+    const specPath = join(dir, 'tools.yaml');
+    writeFileSync(specPath, `tools:\n  - name: echo\n`);
+
+    const implementation = { type: ToolType.MCP, priority: 1, specPath };
+    const tool = new MCPTool({ name: 'mcp-test', implementations: [implementation] }, implementation);
+
+    await tool.initialize();
+
+    await expect(tool.execute('missing', {})).rejects.toThrow('Unknown MCP operation: missing');
+    await expect(tool.execute('toString', {})).rejects.toThrow('Unknown MCP operation: toString');
+    expect(tool.getOperationSchema('toString')).toEqual({});
+  });
 });
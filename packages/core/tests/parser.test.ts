@@ -1,5 +1,10 @@
 import { describe, it, expect } from 'vitest';
-import { parseContent, extractVariableReferences, ParseError } from '../src/parser.js';
+import {
+  parseContent,
+  parseMetadata,
+  extractVariableReferences,
+  ParseError,
+} from '../src/parser.js';
 
 describe('Parser', () => {
   describe('parseContent', () => {
@@ -153,6 +158,50 @@ steps:
     });
   });
 
+  describe('parseMetadata', () => {
+    it('should read metadata without validating the rest of the workflow', () => {
+      const content = `---
+workflow:
+  id: meta-only
+  name: "Metadata Only"
+  version: "2.1.0"
+
+inputs:
+  count:
+    type: not-a-type
+---
+
+# Body
+`;
+
+      expect(() => parseContent(content)).toThrow(ParseError);
+      expect(parseMetadata(content)).toEqual({
+        id: 'meta-only',
+        name: 'Metadata Only',
+        version: '2.1.0',
+        description: undefined,
+        author: undefined,
+        tags: undefined,
+      });
+    });
+
+    it('should apply the same defaults as parseContent', () => {
+      const content = `---
+steps: []
+---
+`;
+
+      const metadata = parseMetadata(content);
+      expect(metadata.id).toBe('unnamed');
+      expect(metadata.name).toBe('Unnamed Workflow');
+      expect(metadata.version).toBe('1.0.0');
+    });
+
+    it('should throw ParseError without frontmatter', () => {
+      expect(() => parseMetadata('# No frontmatter')).toThrow(ParseError);
+    });
+  });
+
   describe('extractVariableReferences', () => {
     it('should extract simple variable references', () => {
       const refs = extractVariableReferences('Hello {{name}}!');
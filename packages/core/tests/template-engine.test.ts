@@ -50,6 +50,22 @@ describe('renderTemplate', () => {
     });
   });
 
+  describe('repeated rendering', () => {
+    it('should return plain text unchanged', () => {
+      expect(renderTemplate('no templates here', { name: 'Alice' })).toBe('no templates here');
+    });
+
+    it('should render the same template against different contexts', () => {
+      const template = 'Hello {{ name }}, you have {{ count }} messages';
+      expect(renderTemplate(template, { name: 'Alice', count: 2 })).toBe(
+        'Hello Alice, you have 2 messages'
+      );
+      expect(renderTemplate(template, { name: 'Bob', count: 5 })).toBe(
+        'Hello Bob, you have 5 messages'
+      );
+    });
+  });
+
   describe('Nunjucks built-in filters', () => {
     it('should apply upper filter', () => {
       const result = renderTemplate('{{ name | upper }}', { name: 'alice' });
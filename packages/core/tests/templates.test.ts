@@ -1,5 +1,13 @@
-import { describe, it, expect } from 'vitest';
-import { TemplateRegistry, HELLO_TEMPLATE } from '../src/templates.js';
+import { describe, it, expect, vi } from 'vitest';
+import { mkdtempSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import {
+  TemplateRegistry,
+  TemplateCategory,
+  WorkflowTemplate,
+  HELLO_TEMPLATE,
+} from '../src/templates.js';
 
 
 describe('TemplateRegistry', () => {
@@ -9,6 +17,14 @@ describe('TemplateRegistry', () => {
     expect(list.length).toBeGreaterThan(0);
     expect(list[0].id).toBe(HELLO_TEMPLATE.id);
   });
+
+  it('filters by category and tags', () => {
+    const registry = new TemplateRegistry();
+    expect(registry.list(HELLO_TEMPLATE.category, ['starter'])).toContain(HELLO_TEMPLATE);
+    expect(registry.list(HELLO_TEMPLATE.category, ['no-such-tag'])).toEqual([]);
+    const security = registry.list(TemplateCategory.SECURITY);
+    expect(security.every((t) => t.category === TemplateCategory.SECURITY)).toBe(true);
+  });
 });
 
 describe('WorkflowTemplate', () => {
@@ -16,4 +32,25 @@ describe('WorkflowTemplate', () => {
     const output = HELLO_TEMPLATE.render({ message: 'Hi' });
     expect(output).toContain('Hi');
   });
+
+  it('keeps a custom frontmatter category and warns about it', () => {
+    const dir = mkdtempSync(join(tmpdir(), 'marktoflow-templates-'));
+    const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+    try {
+      const path = join(dir, 'custom.md');
+      writeFileSync(path, '---\ntemplate:\n  id: custom\n  category: finance\n---\n# Custom\n');
+
+      const template = WorkflowTemplate.fromFile(path);
+
+      expect(template.category).toBe('finance');
+      expect(warn).toHaveBeenCalledWith(expect.stringContaining("unknown category 'finance'"));
+
+      const registry = new TemplateRegistry();
+      registry.register(template);
+      expect(registry.list('finance' as TemplateCategory)).toEqual([template]);
+    } finally {
+      warn.mockRestore();
+      rmSync(dir, { recursive: true, force: true });
+    }
+  });
 });
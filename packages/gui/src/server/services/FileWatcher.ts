@@ -1,6 +1,13 @@
+import { relative, resolve } from 'node:path';
+import type { Stats } from 'node:fs';
 import { watch, type FSWatcher } from 'chokidar';
 import type { Server as SocketIOServer } from 'socket.io';
 
+// Workflow files are markdown or YAML
+const WORKFLOW_FILE = /\.(md|ya?ml)$/;
+// Hidden entries (including .git), node_modules and dist are never watched
+const IGNORED_SEGMENT = /(^|[\\/])(node_modules|dist|\.[^\\/]+)([\\/]|$)/;
+
 export class FileWatcher {
   private watcher: FSWatcher;
   private io: SocketIOServer;
@@ -8,15 +15,19 @@ export class FileWatcher {
   constructor(baseDir: string, io: SocketIOServer) {
     this.io = io;
 
-    // Watch for workflow files
-    this.watcher = watch(['**/*.md', '**/*.yaml', '**/*.yml'], {
-      cwd: baseDir,
-      ignored: [
-        '**/node_modules/**',
-        '**/dist/**',
-        '**/.git/**',
-        '**/.*',
-      ],
+    // Watch the whole directory tree once and filter paths with two
+    // precompiled expressions. chokidar 4 no longer expands globs, so
+    // directories are pruned and non-workflow files dropped here instead.
+    const root = resolve(baseDir);
+    const ignored = (path: string, stats?: Stats): boolean => {
+      const rel = relative(root, resolve(root, path));
+      if (IGNORED_SEGMENT.test(rel)) return true;
+      return stats?.isFile() === true && !WORKFLOW_FILE.test(rel);
+    };
+
+    this.watcher = watch(root, {
+      cwd: root,
+      ignored,
       persistent: true,
       ignoreInitial: true,
       awaitWriteFinish: {
@@ -192,7 +192,7 @@ export class WorkflowService {
   }
 
   async createWorkflow(name: string, template?: string): Promise<WorkflowListItem> {
-    const filename = name.toLowerCase().replace(/\s+/g, '-').replace(/[^a-z0-9-]/g, '') + '.md';
+    const filename = toSlug(name) + '.md';
     const workflowPath = join('workflows', filename);
     const fullPath = join(this.workflowDir, workflowPath);
 
@@ -549,7 +549,7 @@ export class WorkflowService {
   }
 
   private generateWorkflowTemplate(name: string): string {
-    const id = name.toLowerCase().replace(/\s+/g, '-').replace(/[^a-z0-9-]/g, '');
+    const id = toSlug(name);
 
     return `---
 workflow:
@@ -599,3 +599,12 @@ function extractWorkflowInfo(
     version: versionMatch?.[1]?.trim(),
   };
 }
+
+/**
+ * Turn a display name into a lowercase, hyphenated identifier in a single
+ * pass: whitespace runs become hyphens and other disallowed characters are
+ * dropped.
+ */
+function toSlug(name: string): string {
+  return name.toLowerCase().replace(/(\s+)|[^a-z0-9\s-]+/g, (_, space) => (space ? '-' : ''));
+}
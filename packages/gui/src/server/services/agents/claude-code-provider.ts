@@ -13,7 +13,12 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
-import { buildPrompt, generateSuggestions } from './prompts.js';
+import {
+  buildPrompt,
+  generateSuggestions,
+  YAML_BLOCK_PATTERN,
+  EXPLANATION_PATTERN,
+} from './prompts.js';
 
 // Polyfill require for ESM environments (needed by Claude SDK)
 if (typeof globalThis.require === 'undefined') {
@@ -44,16 +49,75 @@ interface AgentQuery extends AsyncGenerator<SDKMessage, void, unknown> {
 // The SDK exports a query function directly
 type QueryFunction = (params: { prompt: string; options?: Record<string, unknown> }) => AgentQuery;
 
+/**
+ * Join the non-empty text blocks of a message in a single pass.
+ * Most assistant messages carry one text block, which is returned as-is.
+ */
+function joinTextBlocks(content: Array<{ type: string; text?: string }>): string {
+  let result: string | undefined;
+  for (const block of content) {
+    if (block.type === 'text' && block.text) {
+      result = result === undefined ? block.text : result + '\n' + block.text;
+    }
+  }
+  return result ?? '';
+}
+
+/**
+ * Return the part of joinTextBlocks(content) that starts at `offset`, without
+ * joining the text that comes before it. Streamed assistant messages are
+ * snapshots of the whole reply so far, so only the new tail is needed.
+ */
+function textBlocksSuffix(content: Array<{ type: string; text?: string }>, offset: number): string {
+  let suffix = '';
+  let position = 0;
+  let first = true;
+  for (const block of content) {
+    if (block.type !== 'text' || !block.text) continue;
+    if (!first) {
+      if (position >= offset) suffix += '\n';
+      position += 1;
+    }
+    first = false;
+    const end = position + block.text.length;
+    if (end > offset) {
+      suffix += position >= offset ? block.text : block.text.slice(offset - position);
+    }
+    position = end;
+  }
+  return suffix;
+}
+
+// Capabilities are identical for every instance, so they are shared
+const CLAUDE_CODE_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([
+    'claude-sonnet-4-20250514',
+    'claude-opus-4-20250514',
+    'claude-3-5-haiku-20241022',
+  ]),
+});
+
+// The SDK import is started once and shared by every provider instance
+let sdkModulePromise: Promise<{ query?: unknown } | null> | null = null;
+
+function loadAgentSdk(): Promise<{ query?: unknown } | null> {
+  if (!sdkModulePromise) {
+    // Dynamic import with webpackIgnore to avoid bundling issues
+    sdkModulePromise = import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk').catch(
+      () => null
+    );
+  }
+  return sdkModulePromise;
+}
+
 export class ClaudeCodeProvider implements AgentProvider {
   readonly id = 'claude-code';
   readonly name = 'Claude Code (SDK)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: ['claude-sonnet-4-20250514', 'claude-opus-4-20250514', 'claude-3-5-haiku-20241022'],
-  };
+  readonly capabilities: AgentCapabilities = CLAUDE_CODE_CAPABILITIES;
 
   private queryFn: QueryFunction | null = null;
   private model: string = 'claude-sonnet-4-20250514';
@@ -65,10 +129,8 @@ export class ClaudeCodeProvider implements AgentProvider {
 
   async initialize(config: AgentConfig): Promise<void> {
     try {
-      // Try to import the Claude Agent SDK (dynamic import with webpackIgnore to avoid bundling issues)
-      const sdkModule = await import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk').catch(
-        () => null
-      );
+      // Try to import the Claude Agent SDK
+      const sdkModule = await loadAgentSdk();
       if (!sdkModule || !sdkModule.query) {
         this.ready = false;
         this.error = 'Claude Agent SDK not installed. Run: npm install @anthropic-ai/claude-agent-sdk';
@@ -172,10 +234,7 @@ export class ClaudeCodeProvider implements AgentProvider {
           if (typeof content === 'string') {
             resultText = content;
           } else if (Array.isArray(content)) {
-            resultText = content
-              .filter((c) => c.type === 'text' && c.text)
-              .map((c) => c.text)
-              .join('\n');
+            resultText = joinTextBlocks(content);
           }
         }
       }
@@ -226,13 +285,9 @@ export class ClaudeCodeProvider implements AgentProvider {
               onChunk(newContent);
             }
           } else if (Array.isArray(content)) {
-            const text = content
-              .filter((c) => c.type === 'text' && c.text)
-              .map((c) => c.text)
-              .join('\n');
-            const newContent = text.slice(fullResponse.length);
+            const newContent = textBlocksSuffix(content, fullResponse.length);
             if (newContent) {
-              fullResponse = text;
+              fullResponse += newContent;
               onChunk(newContent);
             }
           }
@@ -265,7 +320,7 @@ export class ClaudeCodeProvider implements AgentProvider {
   }
 
   private parseAIResponse(responseText: string, originalWorkflow: Workflow): PromptResult {
-    const yamlMatch = responseText.match(/```yaml\n([\s\S]*?)\n```/);
+    const yamlMatch = responseText.match(YAML_BLOCK_PATTERN);
     let modifiedWorkflow: Workflow | undefined;
     let explanation = responseText;
 
@@ -274,7 +329,7 @@ export class ClaudeCodeProvider implements AgentProvider {
         const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
-          const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
+          const explanationMatch = responseText.match(EXPLANATION_PATTERN);
           if (explanationMatch) {
             explanation = explanationMatch[1].trim();
           }
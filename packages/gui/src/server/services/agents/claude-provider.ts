@@ -3,6 +3,7 @@
  * Uses the Anthropic SDK for AI capabilities
  */
 
+import { createHash } from 'node:crypto';
 import Anthropic from '@anthropic-ai/sdk';
 import { parse as yamlParse } from 'yaml';
 import type {
@@ -12,24 +13,80 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
-import { buildPrompt, generateSuggestions } from './prompts.js';
+import {
+  buildPrompt,
+  generateSuggestions,
+  YAML_BLOCK_PATTERN,
+  EXPLANATION_PATTERN,
+} from './prompts.js';
+
+/**
+ * Anthropic clients shared by every provider instance in the process.
+ * Each client owns a keep-alive connection pool, so reusing it lets repeated
+ * and concurrent prompts share warm TLS connections instead of opening new ones.
+ */
+const clientPool = new Map<string, Anthropic>();
+
+function getPooledClient(apiKey: string, baseUrl?: string, timeout?: number): Anthropic {
+  const key = createHash('sha256')
+    .update(`${apiKey}\0${baseUrl ?? ''}\0${timeout ?? ''}`)
+    .digest('hex');
+  let client = clientPool.get(key);
+  if (!client) {
+    client = new Anthropic({
+      apiKey,
+      baseURL: baseUrl,
+      timeout,
+    });
+    clientPool.set(key, client);
+  }
+  return client;
+}
+
+/**
+ * Drop all pooled Anthropic clients (used when credentials are rotated)
+ */
+export function clearClaudeClientPool(): void {
+  clientPool.clear();
+}
+
+// Bounds on the output token budget; the floor is the previous fixed limit
+const MIN_OUTPUT_TOKENS = 4096;
+const MAX_OUTPUT_TOKENS = 8192;
+// Room left for the explanation that accompanies the workflow YAML
+const EXPLANATION_TOKENS = 1024;
+
+/**
+ * Output token budget for a workflow edit. Replies restate the whole workflow
+ * as YAML, so large workflows get a budget that follows the size of the
+ * prompt (~3 chars per token) plus room for the explanation. Small or empty
+ * workflows keep the old 4096 limit, since a request to build one from
+ * scratch still needs room for the complete YAML.
+ */
+function estimateMaxTokens(userPrompt: string): number {
+  const estimate = Math.ceil(userPrompt.length / 3) + EXPLANATION_TOKENS;
+  return Math.min(MAX_OUTPUT_TOKENS, Math.max(MIN_OUTPUT_TOKENS, estimate));
+}
+
+// Capabilities are identical for every instance, so they are shared
+const CLAUDE_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: false,
+  systemPrompts: true,
+  maxContextLength: 200000,
+  models: Object.freeze([
+    'claude-sonnet-4-20250514',
+    'claude-opus-4-20250514',
+    'claude-3-5-sonnet-20241022',
+    'claude-3-5-haiku-20241022',
+  ]),
+});
 
 export class ClaudeProvider implements AgentProvider {
   readonly id = 'claude';
   readonly name = 'Claude (Anthropic)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: false,
-    systemPrompts: true,
-    maxContextLength: 200000,
-    models: [
-      'claude-sonnet-4-20250514',
-      'claude-opus-4-20250514',
-      'claude-3-5-sonnet-20241022',
-      'claude-3-5-haiku-20241022',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = CLAUDE_CAPABILITIES;
 
   private client: Anthropic | null = null;
   private model: string = 'claude-sonnet-4-20250514';
@@ -45,11 +102,7 @@ export class ClaudeProvider implements AgentProvider {
         return;
       }
 
-      this.client = new Anthropic({
-        apiKey,
-        baseURL: config.baseUrl,
-        timeout: config.timeout,
-      });
+      this.client = getPooledClient(apiKey, config.baseUrl, config.timeout);
 
       if (config.model) {
         this.model = config.model;
@@ -93,7 +146,7 @@ export class ClaudeProvider implements AgentProvider {
 
       const response = await this.client.messages.create({
         model: this.model,
-        max_tokens: 4096,
+        max_tokens: estimateMaxTokens(userPrompt),
         system: systemPrompt,
         messages: [
           {
@@ -139,7 +192,7 @@ export class ClaudeProvider implements AgentProvider {
     try {
       const stream = await this.client.messages.create({
         model: this.model,
-        max_tokens: 4096,
+        max_tokens: estimateMaxTokens(userPrompt),
         system: systemPrompt,
         stream: true,
         messages: [
@@ -171,7 +224,7 @@ export class ClaudeProvider implements AgentProvider {
   }
 
   private parseAIResponse(responseText: string, originalWorkflow: Workflow): PromptResult {
-    const yamlMatch = responseText.match(/```yaml\n([\s\S]*?)\n```/);
+    const yamlMatch = responseText.match(YAML_BLOCK_PATTERN);
     let modifiedWorkflow: Workflow | undefined;
     let explanation = responseText;
 
@@ -180,7 +233,7 @@ export class ClaudeProvider implements AgentProvider {
         const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
-          const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
+          const explanationMatch = responseText.match(EXPLANATION_PATTERN);
           if (explanationMatch) {
             explanation = explanationMatch[1].trim();
           }
@@ -11,7 +11,12 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
-import { buildPrompt, generateSuggestions } from './prompts.js';
+import {
+  buildPrompt,
+  generateSuggestions,
+  YAML_BLOCK_PATTERN,
+  EXPLANATION_PATTERN,
+} from './prompts.js';
 
 // Dynamic import types for Codex SDK
 interface CodexSDK {
@@ -83,22 +88,25 @@ interface CodexInstance {
   resumeThread(id: string, options?: ThreadOptions): Thread;
 }
 
+// Capabilities are identical for every instance, so they are shared
+const CODEX_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([
+    'codex-1',
+    'o3',
+    'o3-mini',
+    'o4-mini',
+    'gpt-4.1',
+  ]),
+});
+
 export class CodexProvider implements AgentProvider {
   readonly id = 'codex';
   readonly name = 'OpenAI Codex';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: [
-      'codex-1',
-      'o3',
-      'o3-mini',
-      'o4-mini',
-      'gpt-4.1',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = CODEX_CAPABILITIES;
 
   private codex: CodexInstance | null = null;
   private model: string = 'codex-1';
@@ -343,7 +351,7 @@ export class CodexProvider implements AgentProvider {
   }
 
   private parseAIResponse(responseText: string, originalWorkflow: Workflow): PromptResult {
-    const yamlMatch = responseText.match(/```yaml\n([\s\S]*?)\n```/);
+    const yamlMatch = responseText.match(YAML_BLOCK_PATTERN);
     let modifiedWorkflow: Workflow | undefined;
     let explanation = responseText;
 
@@ -352,7 +360,7 @@ export class CodexProvider implements AgentProvider {
         const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
-          const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
+          const explanationMatch = responseText.match(EXPLANATION_PATTERN);
           if (explanationMatch) {
             explanation = explanationMatch[1].trim();
           }
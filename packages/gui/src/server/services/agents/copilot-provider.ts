@@ -12,7 +12,12 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
-import { buildPrompt, generateSuggestions } from './prompts.js';
+import {
+  buildPrompt,
+  generateSuggestions,
+  YAML_BLOCK_PATTERN,
+  EXPLANATION_PATTERN,
+} from './prompts.js';
 
 // Polyfill require for ESM environments (needed by Copilot SDK dependencies)
 if (typeof globalThis.require === 'undefined') {
@@ -50,21 +55,24 @@ interface SessionEvent {
   };
 }
 
+// Capabilities are identical for every instance, so they are shared
+const COPILOT_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([
+    'gpt-4.1',
+    'gpt-4o',
+    'gpt-4-turbo',
+    'claude-3.5-sonnet',
+  ]),
+});
+
 export class CopilotProvider implements AgentProvider {
   readonly id = 'copilot';
   readonly name = 'GitHub Copilot';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: [
-      'gpt-4.1',
-      'gpt-4o',
-      'gpt-4-turbo',
-      'claude-3.5-sonnet',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = COPILOT_CAPABILITIES;
 
   // Using 'unknown' to handle SDK version differences
   private client: unknown = null;
@@ -256,7 +264,7 @@ export class CopilotProvider implements AgentProvider {
   }
 
   private parseAIResponse(responseText: string, originalWorkflow: Workflow): PromptResult {
-    const yamlMatch = responseText.match(/```yaml\n([\s\S]*?)\n```/);
+    const yamlMatch = responseText.match(YAML_BLOCK_PATTERN);
     let modifiedWorkflow: Workflow | undefined;
     let explanation = responseText;
 
@@ -265,7 +273,7 @@ export class CopilotProvider implements AgentProvider {
         const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
-          const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
+          const explanationMatch = responseText.match(EXPLANATION_PATTERN);
           if (explanationMatch) {
             explanation = explanationMatch[1].trim();
           }
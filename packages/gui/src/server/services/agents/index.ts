@@ -25,7 +25,7 @@
 export * from './types.js';
 export * from './registry.js';
 export * from './prompts.js';
-export { ClaudeProvider, createClaudeProvider } from './claude-provider.js';
+export { ClaudeProvider, createClaudeProvider, clearClaudeClientPool } from './claude-provider.js';
 export { CopilotProvider, createCopilotProvider } from './copilot-provider.js';
 export { DemoProvider, createDemoProvider } from './demo-provider.js';
 export { OllamaProvider, createOllamaProvider } from './ollama-provider.js';
@@ -11,6 +11,7 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
+import { YAML_BLOCK_PATTERN, EXPLANATION_PATTERN } from './prompts.js';
 
 const SYSTEM_PROMPT = `You are an expert workflow automation assistant. Help users modify their workflows.
 
@@ -23,24 +24,27 @@ Respond with:
 1. A brief explanation of changes
 2. The complete modified workflow in YAML format between \`\`\`yaml and \`\`\``;
 
+// Capabilities are identical for every instance, so they are shared
+const OLLAMA_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: false,
+  codeExecution: false,
+  systemPrompts: true,
+  models: Object.freeze([
+    'llama3.2',
+    'llama3.1',
+    'codellama',
+    'mistral',
+    'mixtral',
+    'phi3',
+    'gemma2',
+  ]),
+});
+
 export class OllamaProvider implements AgentProvider {
   readonly id = 'ollama';
   readonly name = 'Ollama (Local)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: false,
-    codeExecution: false,
-    systemPrompts: true,
-    models: [
-      'llama3.2',
-      'llama3.1',
-      'codellama',
-      'mistral',
-      'mixtral',
-      'phi3',
-      'gemma2',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = OLLAMA_CAPABILITIES;
 
   private baseUrl: string = 'http://localhost:11434';
   private model: string = 'llama3.2';
@@ -212,7 +216,7 @@ export class OllamaProvider implements AgentProvider {
   }
 
   private parseAIResponse(responseText: string, originalWorkflow: Workflow): PromptResult {
-    const yamlMatch = responseText.match(/```yaml\n([\s\S]*?)\n```/);
+    const yamlMatch = responseText.match(YAML_BLOCK_PATTERN);
     let modifiedWorkflow: Workflow | undefined;
     let explanation = responseText;
 
@@ -221,7 +225,7 @@ export class OllamaProvider implements AgentProvider {
         const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
-          const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
+          const explanationMatch = responseText.match(EXPLANATION_PATTERN);
           if (explanationMatch) {
             explanation = explanationMatch[1].trim();
           }
@@ -9,6 +9,12 @@
  * - Adding conditions
  */
 
+// Fenced YAML block holding the modified workflow in a provider response
+export const YAML_BLOCK_PATTERN = /```yaml\n([\s\S]*?)\n```/;
+
+// Explanation text preceding the YAML block
+export const EXPLANATION_PATTERN = /^([\s\S]*?)```yaml/;
+
 // Available service integrations with their SDK mappings
 export const AVAILABLE_SERVICES = {
   slack: {
@@ -355,6 +361,28 @@ Authentication patterns:
 `,
 };
 
+// System prompts keyed by the detected operation set. There are only a handful
+// of combinations in practice, so each one is assembled once and reused.
+const systemPromptCache = new Map<string, string>();
+
+/**
+ * Get the system prompt for a set of operations, composing it on first use
+ */
+function getSystemPrompt(operations: string[]): string {
+  const key = operations.join(',');
+  let systemPrompt = systemPromptCache.get(key);
+  if (systemPrompt === undefined) {
+    systemPrompt = BASE_SYSTEM_PROMPT;
+    for (const op of operations) {
+      if (OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS]) {
+        systemPrompt += '\n' + OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS];
+      }
+    }
+    systemPromptCache.set(key, systemPrompt);
+  }
+  return systemPrompt;
+}
+
 /**
  * Build a context-aware prompt based on the user's request
  */
@@ -370,12 +398,7 @@ export function buildPrompt(
   const operations = detectOperations(userRequest);
 
   // Build system prompt with relevant operation guides
-  let systemPrompt = BASE_SYSTEM_PROMPT;
-  for (const op of operations) {
-    if (OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS]) {
-      systemPrompt += '\n' + OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS];
-    }
-  }
+  const systemPrompt = getSystemPrompt(operations);
 
   // Build user prompt with context
   let userPrompt = `Current workflow:\n\`\`\`yaml\n${formatWorkflow(workflow)}\n\`\`\`\n\n`;
@@ -40,17 +40,17 @@ export interface PromptHistoryItem {
 
 export interface AgentCapabilities {
   /** Whether the provider supports streaming responses */
-  streaming: boolean;
+  readonly streaming: boolean;
   /** Whether the provider supports tool use */
-  toolUse: boolean;
+  readonly toolUse: boolean;
   /** Whether the provider supports code execution */
-  codeExecution: boolean;
+  readonly codeExecution: boolean;
   /** Whether the provider supports system prompts */
-  systemPrompts: boolean;
+  readonly systemPrompts: boolean;
   /** Maximum context length in tokens */
-  maxContextLength?: number;
+  readonly maxContextLength?: number;
   /** List of available models */
-  models: string[];
+  readonly models: readonly string[];
 }
 
 export interface AgentConfig {
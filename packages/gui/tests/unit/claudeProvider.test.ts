@@ -0,0 +1,91 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+const { AnthropicMock } = vi.hoisted(() => ({
+  AnthropicMock: vi.fn().mockImplementation(() => ({
+    messages: {
+      create: vi.fn().mockResolvedValue({
+        content: [{ type: 'text', text: 'Plain explanation' }],
+      }),
+    },
+  })),
+}));
+
+vi.mock('@anthropic-ai/sdk', () => ({ default: AnthropicMock }));
+
+import {
+  ClaudeProvider,
+  clearClaudeClientPool,
+} from '../../src/server/services/agents/claude-provider.js';
+
+describe('ClaudeProvider', () => {
+  beforeEach(() => {
+    clearClaudeClientPool();
+    AnthropicMock.mockClear();
+  });
+
+  describe('client pooling', () => {
+    it('should share one client across providers with the same credentials', async () => {
+      const first = new ClaudeProvider();
+      const second = new ClaudeProvider();
+
+      await first.initialize({ apiKey: 'sk-test' });
+      await second.initialize({ apiKey: 'sk-test' });
+
+      expect(first.isReady()).toBe(true);
+      expect(second.isReady()).toBe(true);
+      expect(AnthropicMock).toHaveBeenCalledTimes(1);
+    });
+
+    it('should create separate clients for different credentials', async () => {
+      await new ClaudeProvider().initialize({ apiKey: 'sk-one' });
+      await new ClaudeProvider().initialize({ apiKey: 'sk-two' });
+      await new ClaudeProvider().initialize({ apiKey: 'sk-one', baseUrl: 'http://proxy' });
+
+      expect(AnthropicMock).toHaveBeenCalledTimes(3);
+    });
+
+    it('should not create a client without an API key', async () => {
+      const previous = process.env.ANTHROPIC_API_KEY;
+      delete process.env.ANTHROPIC_API_KEY;
+      try {
+        const provider = new ClaudeProvider();
+        await provider.initialize({});
+
+        expect(provider.isReady()).toBe(false);
+        expect(AnthropicMock).not.toHaveBeenCalled();
+      } finally {
+        if (previous !== undefined) process.env.ANTHROPIC_API_KEY = previous;
+      }
+    });
+  });
+
+  describe('output token budget', () => {
+    const lastCreateParams = () => {
+      const client = AnthropicMock.mock.results[0].value;
+      return client.messages.create.mock.calls.at(-1)[0];
+    };
+
+    it('should keep the 4096 floor for small workflows', async () => {
+      const provider = new ClaudeProvider();
+      await provider.initialize({ apiKey: 'sk-budget' });
+
+      await provider.processPrompt('Add a step', { metadata: { name: 'tiny' }, steps: [] } as any);
+
+      expect(lastCreateParams().max_tokens).toBe(4096);
+    });
+
+    it('should grow the budget with the workflow size up to the cap', async () => {
+      const provider = new ClaudeProvider();
+      await provider.initialize({ apiKey: 'sk-budget' });
+
+      const steps = Array.from({ length: 400 }, (_, i) => ({
+        id: `step-${i}`,
+        action: 'slack.chat.postMessage',
+        inputs: { channel: '#general', text: `Message number ${i}` },
+      }));
+      await provider.processPrompt('Add a step', { metadata: { name: 'large' }, steps } as any);
+
+      expect(lastCreateParams().max_tokens).toBe(8192);
+    });
+  });
+});
@@ -45,6 +45,39 @@ interface AgentQuery extends AsyncGenerator<SDKMessage, void, unknown> {
   interrupt(): Promise<void>;
 }
 
+// The SDK import is started once and shared by every client and helper, so
+// concurrent first calls wait on one load instead of each importing it
+let agentSdkPromise: Promise<AgentSDK | null> | null = null;
+
+/**
+ * Load the Agent SDK (optional dependency), resolving to null if not installed
+ */
+function loadAgentSDK(): Promise<AgentSDK | null> {
+  if (!agentSdkPromise) {
+    agentSdkPromise = import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk')
+      .then((module) => module as unknown as AgentSDK)
+      .catch(() => null);
+  }
+  return agentSdkPromise;
+}
+
+/**
+ * Join the text blocks of an assistant message's content in a single pass
+ */
+function extractAssistantText(content: string | Array<{ type: string; text?: string }>): string {
+  if (typeof content === 'string') {
+    return content;
+  }
+  let result: string | undefined;
+  for (const block of content) {
+    if (block.type === 'text') {
+      const text = block.text ?? '';
+      result = result === undefined ? text : result + '\n' + text;
+    }
+  }
+  return result ?? '';
+}
+
 // ============================================================================
 // Claude Agent Client
 // ============================================================================
@@ -78,11 +111,7 @@ export class ClaudeAgentClient {
   private async getSDK(): Promise<AgentSDK> {
     if (!this.sdk) {
       try {
-        // Dynamic import of the Agent SDK (optional dependency)
-        // eslint-disable-next-line @typescript-eslint/no-var-requires
-        const module = await import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk').catch(
-          () => null
-        );
+        const module = await loadAgentSDK();
         if (!module) {
           throw new Error('SDK not installed');
         }
@@ -124,6 +153,50 @@ export class ClaudeAgentClient {
     return result.result || '';
   }
 
+  /**
+   * Stream response text as it is generated (simple interface)
+   *
+   * Yields partial deltas as they arrive, falling back to assistant message
+   * text when the SDK does not emit partials, so callers see the first tokens
+   * without waiting for the whole generation to finish.
+   *
+   * @param inputs - Prompt string or object with prompt and options
+   * @returns Async generator yielding text chunks
+   */
+  async *generateStream(
+    inputs: { prompt: string; model?: string } | string
+  ): AsyncGenerator<string, void, unknown> {
+    const prompt = typeof inputs === 'string' ? inputs : inputs.prompt;
+    const modelOverride = typeof inputs === 'string' ? undefined : inputs.model;
+
+    let emitted = false;
+    let sawPartial = false;
+
+    for await (const message of this.query(prompt, {
+      model: modelOverride || this.options.model,
+      allowedTools: [],
+    })) {
+      if (message.type === 'partial') {
+        if (message.delta) {
+          sawPartial = true;
+          emitted = true;
+          yield message.delta;
+        }
+      } else if (message.type === 'assistant' && !sawPartial && message.message) {
+        const text = extractAssistantText(message.message.content);
+        if (text) {
+          emitted = true;
+          yield text;
+        }
+      } else if (message.type === 'result') {
+        this.sessionId = message.session_id || null;
+        if (!emitted && message.result) {
+          yield message.result;
+        }
+      }
+    }
+  }
+
   // ============================================================================
   // Full Agentic Interface
   // ============================================================================
@@ -172,15 +245,7 @@ export class ClaudeAgentClient {
 
     let resultText = '';
     if (lastAssistant?.type === 'assistant' && lastAssistant.message) {
-      const content = lastAssistant.message.content;
-      if (typeof content === 'string') {
-        resultText = content;
-      } else if (Array.isArray(content)) {
-        resultText = content
-          .filter((c) => c.type === 'text')
-          .map((c) => c.text)
-          .join('\n');
-      }
+      resultText = extractAssistantText(lastAssistant.message.content);
     }
 
     return {
@@ -535,10 +600,7 @@ export async function createCustomTool<T>(
   handler: (args: unknown) => Promise<{ content: Array<{ type: string; text: string }> }>
 ): Promise<unknown> {
   try {
-    // Dynamic import of the Agent SDK (optional dependency)
-    const module = (await import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk').catch(
-      () => null
-    )) as { tool?: unknown } | null;
+    const module = (await loadAgentSDK()) as { tool?: unknown } | null;
     if (!module?.tool) {
       throw new Error('SDK not installed');
     }
@@ -570,10 +632,7 @@ export async function createMcpServer(
   version = '1.0.0'
 ): Promise<unknown> {
   try {
-    // Dynamic import of the Agent SDK (optional dependency)
-    const module = (await import(/* webpackIgnore: true */ '@anthropic-ai/claude-agent-sdk').catch(
-      () => null
-    )) as { createSdkMcpServer?: unknown } | null;
+    const module = (await loadAgentSDK()) as { createSdkMcpServer?: unknown } | null;
     if (!module?.createSdkMcpServer) {
       throw new Error('SDK not installed');
     }
@@ -1,23 +1,111 @@
-import { spawn } from 'node:child_process';
+import { spawn, type ChildProcessWithoutNullStreams } from 'node:child_process';
+import type { Socket } from 'node:net';
+import { StringDecoder } from 'node:string_decoder';
 import { ToolConfig, SDKInitializer } from '@marktoflow/core';
+import { StderrTail } from './stderr-tail.js';
+
+/** Raised when the persistent CLI session exits before answering */
+class SessionExitError extends Error {}
+
+interface PendingTurn {
+  resolve: (text: string) => void;
+  reject: (error: Error) => void;
+}
+
+/**
+ * One persistent `claude` process and the state of its output stream. The
+ * turn and partial line belong to the process, so output or an exit from a
+ * session that has already been replaced can't touch the current one.
+ */
+interface CliSession {
+  process: ChildProcessWithoutNullStreams;
+  // Pieces of the current unterminated output line, joined once it completes
+  partial: string[];
+  pending: PendingTurn | null;
+}
+
+/**
+ * Hold or release the event loop on a persistent session. An idle session is
+ * unreferenced so a finished workflow can exit without an explicit close();
+ * the CLI then sees stdin close and exits on its own.
+ */
+function setSessionRef(session: ChildProcessWithoutNullStreams, active: boolean): void {
+  for (const stream of [session.stdin, session.stdout, session.stderr]) {
+    const socket = stream as Partial<Pick<Socket, 'ref' | 'unref'>>;
+    if (active) socket.ref?.();
+    else socket.unref?.();
+  }
+  if (active) session.ref();
+  else session.unref();
+}
 
 export class ClaudeCodeClient {
+  private session: CliSession | null = null;
+  private sessionEstablished = false;
+  private sessionUnsupported = false;
+  private sessionQueue: Promise<unknown> = Promise.resolve();
+
   constructor(private options: {
     cliPath?: string;
     model?: string;
     cwd?: string;
     timeout?: number;
+    /**
+     * Keep one `claude` process alive and stream prompts to it over stdin.
+     * Every generate() call is sent as a new user message in the same
+     * conversation, so the model sees earlier prompts and answers. Call
+     * close() to start a fresh conversation on the next call.
+     */
+    persistent?: boolean;
   } = {}) {}
 
   async generate(inputs: { prompt: string; model?: string } | string): Promise<string> {
     const prompt = typeof inputs === 'string' ? inputs : inputs.prompt;
     const modelOverride = typeof inputs === 'string' ? undefined : inputs.model;
 
+    const canUseSession =
+      this.options.persistent &&
+      !this.sessionUnsupported &&
+      (!modelOverride || modelOverride === this.options.model);
+
+    if (canUseSession) {
+      try {
+        return await this.generateViaSession(prompt);
+      } catch (error) {
+        // A session that exits before ever producing a result means the CLI
+        // does not support stream-json input; fall back to one process per prompt.
+        if (this.sessionEstablished || !(error instanceof SessionExitError)) {
+          throw error;
+        }
+        this.sessionUnsupported = true;
+      }
+    }
+
+    return this.generateViaProcess(prompt, modelOverride);
+  }
+
+  /**
+   * Stop the persistent CLI session, if one is running. The next persistent
+   * call spawns a new session, which starts a fresh conversation.
+   */
+  close(): void {
+    const session = this.session;
+    if (!session) return;
+    this.session = null;
+    session.process.stdin.end();
+    const pending = session.pending;
+    session.pending = null;
+    pending?.reject(new Error('Claude Code CLI session was closed'));
+  }
+
+  private generateViaProcess(prompt: string, modelOverride?: string): Promise<string> {
     const cliPath = this.options.cliPath || 'claude';
     const cwd = this.options.cwd || process.cwd();
     const timeout = this.options.timeout || 120000;
     
-    const args = ['-p', prompt];
+    // The prompt is piped over stdin rather than passed as an argument, so
+    // large prompts don't hit the OS argument size limit
+    const args = ['-p'];
     const model = modelOverride || this.options.model;
     if (model) {
       args.push('--model', model);
@@ -26,11 +114,14 @@ export class ClaudeCodeClient {
     return new Promise((resolve, reject) => {
       const process = spawn(cliPath, args, { cwd });
       
+      // Decoders keep multi-byte UTF-8 characters intact across chunk boundaries
+      const stdoutDecoder = new StringDecoder('utf8');
+      const stderrDecoder = new StringDecoder('utf8');
       let stdout = '';
       let stderr = '';
 
-      process.stdout.on('data', (data) => { stdout += data.toString(); });
-      process.stderr.on('data', (data) => { stderr += data.toString(); });
+      process.stdout.on('data', (data) => { stdout += stdoutDecoder.write(data); });
+      process.stderr.on('data', (data) => { stderr += stderrDecoder.write(data); });
 
       const timeoutId = setTimeout(() => {
         process.kill();
@@ -39,6 +130,8 @@ export class ClaudeCodeClient {
 
       process.on('close', (code) => {
         clearTimeout(timeoutId);
+        stdout += stdoutDecoder.end();
+        stderr += stderrDecoder.end();
         if (code === 0) {
           resolve(stdout.trim());
         } else {
@@ -51,9 +144,172 @@ export class ClaudeCodeClient {
         clearTimeout(timeoutId);
         reject(err);
       });
+
+      process.stdin.on('error', () => {
+        // The CLI exited before reading the prompt; the close handler reports it
+      });
+      process.stdin.end(prompt);
     });
   }
 
+  /**
+   * Send a prompt to the persistent session and wait for its result event.
+   * Turns are serialized because the CLI answers one user message at a time.
+   */
+  private generateViaSession(prompt: string): Promise<string> {
+    const timeout = this.options.timeout || 120000;
+
+    const runTurn = () =>
+      new Promise<string>((resolve, reject) => {
+        const session = this.ensureSession();
+        setSessionRef(session.process, true);
+
+        const timeoutId = setTimeout(() => {
+          session.pending = null;
+          // Forget the session before killing it, so the next turn spawns a
+          // fresh process instead of writing to the dying one
+          if (this.session === session) {
+            this.session = null;
+          }
+          session.process.kill();
+          reject(new Error(`Claude Code CLI timed out after ${timeout}ms`));
+        }, timeout);
+
+        session.pending = {
+          resolve: (text) => {
+            clearTimeout(timeoutId);
+            setSessionRef(session.process, false);
+            resolve(text);
+          },
+          reject: (error) => {
+            clearTimeout(timeoutId);
+            setSessionRef(session.process, false);
+            reject(error);
+          },
+        };
+
+        session.process.stdin.write(
+          JSON.stringify({ type: 'user', message: { role: 'user', content: prompt } }) + '\n'
+        );
+      });
+
+    const turn = this.sessionQueue.then(runTurn, runTurn);
+    this.sessionQueue = turn.catch(() => undefined);
+    return turn;
+  }
+
+  private ensureSession(): CliSession {
+    if (this.session) {
+      return this.session;
+    }
+
+    const cliPath = this.options.cliPath || 'claude';
+    const cwd = this.options.cwd || process.cwd();
+    const args = [
+      '-p',
+      '--input-format',
+      'stream-json',
+      '--output-format',
+      'stream-json',
+      '--verbose',
+    ];
+    if (this.options.model) {
+      args.push('--model', this.options.model);
+    }
+
+    const child = spawn(cliPath, args, { cwd });
+    const session: CliSession = { process: child, partial: [], pending: null };
+    const stdoutDecoder = new StringDecoder('utf8');
+    const stderrTail = new StderrTail();
+
+    child.stdout.on('data', (data) => {
+      // Late output from a killed or closed session is dropped
+      if (this.session !== session) return;
+      this.handleSessionOutput(session, stdoutDecoder.write(data));
+    });
+    child.stderr.on('data', (data) => stderrTail.push(data));
+
+    const fail = (error: Error) => {
+      if (this.session !== session) return;
+      this.session = null;
+      const pending = session.pending;
+      session.pending = null;
+      pending?.reject(error);
+    };
+
+    child.on('close', (code) => {
+      fail(
+        new SessionExitError(
+          `Claude Code CLI session exited (exit code ${code})\nSTDERR: ${stderrTail.end()}`
+        )
+      );
+    });
+    child.on('error', fail);
+    // Writing a prompt to a session that has just exited raises EPIPE here
+    child.stdin.on('error', fail);
+
+    this.session = session;
+    return session;
+  }
+
+  private handleSessionOutput(session: CliSession, chunk: string): void {
+    // Only the new chunk is searched for line breaks. A long event that
+    // arrives over many chunks is collected piecewise and joined once, rather
+    // than being re-copied and rescanned from the start on every chunk
+    let newline = chunk.indexOf('\n');
+    if (newline === -1) {
+      if (chunk) session.partial.push(chunk);
+      return;
+    }
+
+    let line = chunk.slice(0, newline);
+    if (session.partial.length > 0) {
+      session.partial.push(line);
+      line = session.partial.join('');
+      session.partial = [];
+    }
+
+    // Walk every complete line in the chunk, then keep only the trailing
+    // partial line, so a chunk carrying many events is sliced once per line
+    let lineStart = newline + 1;
+    while (true) {
+      this.handleSessionLine(session, line.trim());
+      newline = chunk.indexOf('\n', lineStart);
+      if (newline === -1) break;
+      line = chunk.slice(lineStart, newline);
+      lineStart = newline + 1;
+    }
+
+    if (lineStart < chunk.length) {
+      session.partial.push(chunk.slice(lineStart));
+    }
+  }
+
+  private handleSessionLine(session: CliSession, line: string): void {
+    // Only result events are acted on; skip parsing the assistant and tool
+    // events in between, which make up most of the stream
+    if (!line || !line.includes('"result"')) return;
+
+    let event: { type?: string; result?: unknown; is_error?: boolean };
+    try {
+      event = JSON.parse(line);
+    } catch {
+      return;
+    }
+
+    if (event.type === 'result' && session.pending) {
+      const pending = session.pending;
+      session.pending = null;
+      this.sessionEstablished = true;
+      const text = typeof event.result === 'string' ? event.result.trim() : '';
+      if (event.is_error) {
+        pending.reject(new Error(`Claude Code CLI failed: ${text}`));
+      } else {
+        pending.resolve(text);
+      }
+    }
+  }
+
   /**
    * OpenAI-compatible chat interface for workflow compatibility
    */
@@ -102,6 +358,7 @@ export const ClaudeCodeInitializer: SDKInitializer = {
       model: options['model'] as string,
       cwd: options['cwd'] as string,
       timeout: options['timeout'] as number,
+      persistent: options['persistent'] as boolean,
     });
   },
 };
@@ -1,12 +1,142 @@
 import { spawn } from 'node:child_process';
+import { StringDecoder } from 'node:string_decoder';
 import { ToolConfig, SDKInitializer } from '@marktoflow/core';
 import { createOpencodeClient, OpencodeClient } from '@opencode-ai/sdk';
+import { StderrTail } from './stderr-tail.js';
+
+/**
+ * After a server request fails in auto mode, calls to the same server URL go
+ * straight to the CLI for a while instead of paying for another failed probe.
+ * The wait doubles with each consecutive failure, so a server that has just
+ * been started is picked up quickly while one that stays down is rarely probed.
+ */
+const SERVER_RETRY_MIN_MS = 1000;
+const SERVER_RETRY_MAX_MS = 60000;
+
+// Backoff state per server URL; retryAt is on the monotonic clock
+const serverBackoff = new Map<string, { retryAt: number; delay: number }>();
+
+// SDK clients shared by every OpenCodeClient pointing at the same server, so
+// their requests reuse one keep-alive connection pool
+const sdkClientPool = new Map<string, OpencodeClient>();
+
+function getPooledSdkClient(serverUrl: string): OpencodeClient {
+  let client = sdkClientPool.get(serverUrl);
+  if (!client) {
+    client = createOpencodeClient({
+      baseUrl: serverUrl,
+    });
+    sdkClientPool.set(serverUrl, client);
+  }
+  return client;
+}
+
+/** Shape of a session.prompt response body that carries reply text */
+interface PromptResponseData {
+  parts?: Array<{ type?: string; text?: string }>;
+  text?: string;
+}
+
+/**
+ * Extract the reply text from a session.prompt response
+ */
+function extractResponseText(data: PromptResponseData): string {
+  const parts = data.parts;
+  if (parts) {
+    // Most replies are a single text part
+    if (parts.length === 1) {
+      return parts[0].type === 'text' ? parts[0].text || '' : '';
+    }
+    // Only text parts form the reply; reasoning and tool parts also carry text
+    let text = '';
+    for (const part of parts) {
+      if (part.type === 'text' && part.text) text += part.text;
+    }
+    return text;
+  }
+  if (data.text) {
+    return data.text;
+  }
+  return JSON.stringify(data);
+}
+
+const OUTPUT_OPEN_TAG = '<output>';
+const OUTPUT_CLOSE_TAG = '</output>';
+
+/**
+ * Incrementally strips the <output>...</output> wrapper and surrounding
+ * whitespace from streamed CLI output. Text that might still turn out to be
+ * the opening tag, the closing tag or trailing whitespace is held back until
+ * more output arrives or the stream ends.
+ *
+ * A leading opening tag is stripped as soon as it is seen, whether or not a
+ * closing tag follows; the closing tag is stripped only after an opening
+ * one. generate() runs complete CLI output through the same filter, so both
+ * paths return the same text.
+ */
+class OutputTagFilter {
+  private pending = '';
+  private resolved = false;
+  private tagged = false;
+  private skipLeading = false;
+
+  push(text: string): string {
+    let buffer = this.pending + text;
+
+    if (!this.resolved) {
+      const trimmed = buffer.trimStart();
+      if (trimmed.length < OUTPUT_OPEN_TAG.length && OUTPUT_OPEN_TAG.startsWith(trimmed)) {
+        this.pending = trimmed;
+        return '';
+      }
+      this.resolved = true;
+      this.tagged = trimmed.startsWith(OUTPUT_OPEN_TAG);
+      this.skipLeading = this.tagged;
+      buffer = this.tagged ? trimmed.slice(OUTPUT_OPEN_TAG.length) : trimmed;
+    }
+
+    if (this.skipLeading) {
+      buffer = buffer.trimStart();
+      if (!buffer) {
+        this.pending = '';
+        return '';
+      }
+      this.skipLeading = false;
+    }
+
+    // Hold back trailing whitespace and, when tagged, anything that could be
+    // the start of the closing tag along with the whitespace before it
+    const body = buffer.trimEnd();
+    let holdFrom = body.length;
+    if (this.tagged) {
+      holdFrom = Math.max(0, holdFrom - OUTPUT_CLOSE_TAG.length);
+      while (holdFrom > 0 && /\s/.test(body[holdFrom - 1])) holdFrom--;
+    }
+
+    this.pending = buffer.slice(holdFrom);
+    return buffer.slice(0, holdFrom);
+  }
+
+  end(): string {
+    let rest = this.pending;
+    this.pending = '';
+    if (!this.resolved || this.skipLeading) {
+      rest = rest.trimStart();
+    }
+    rest = rest.trimEnd();
+    if (this.tagged && rest.endsWith(OUTPUT_CLOSE_TAG)) {
+      rest = rest.slice(0, -OUTPUT_CLOSE_TAG.length).trimEnd();
+    }
+    return rest;
+  }
+}
 
 export class OpenCodeClient {
   private mode: 'cli' | 'server' | 'auto';
   private serverUrl: string;
   private cliPath: string;
   private model: string | undefined;
+  private timeout: number;
   // @ts-ignore - Stored for future SDK support
   private excludeFiles: string[] | undefined;
   private sdkClient: OpencodeClient | null = null;
@@ -17,20 +147,17 @@ export class OpenCodeClient {
     cliPath?: string;
     model?: string;
     excludeFiles?: string[];
+    /** Milliseconds before a CLI run is killed */
+    timeout?: number;
   } = {}) {
     this.mode = options.mode || 'auto';
     this.serverUrl = options.serverUrl || 'http://localhost:4096';
     this.cliPath = options.cliPath || 'opencode';
     this.model = options.model;
+    this.timeout = options.timeout || 120000;
     this.excludeFiles = options.excludeFiles;
     // NOTE: excludeFiles is stored but not yet passed to SDK
     // Will be used when underlying @opencode-ai/sdk supports it
-
-    if (this.mode === 'server' || this.mode === 'auto') {
-      this.sdkClient = createOpencodeClient({
-        baseUrl: this.serverUrl,
-      });
-    }
   }
 
   async generate(inputs: { prompt: string } | string): Promise<string> {
@@ -42,17 +169,26 @@ export class OpenCodeClient {
       return this.generateViaCli(prompt);
     } else {
       // Auto mode: try server, fall back to CLI
-      try {
-        return await this.generateViaServer(prompt);
-      } catch (e) {
-        return this.generateViaCli(prompt);
+      const backoff = serverBackoff.get(this.serverUrl);
+      if (!backoff || performance.now() >= backoff.retryAt) {
+        try {
+          const result = await this.generateViaServer(prompt);
+          serverBackoff.delete(this.serverUrl);
+          return result;
+        } catch (e) {
+          const delay = backoff
+            ? Math.min(backoff.delay * 2, SERVER_RETRY_MAX_MS)
+            : SERVER_RETRY_MIN_MS;
+          serverBackoff.set(this.serverUrl, { retryAt: performance.now() + delay, delay });
+        }
       }
+      return this.generateViaCli(prompt);
     }
   }
 
   private async generateViaServer(prompt: string): Promise<string> {
     if (!this.sdkClient) {
-      throw new Error('OpenCode SDK client not initialized');
+      this.sdkClient = getPooledSdkClient(this.serverUrl);
     }
 
     // Create session
@@ -77,53 +213,149 @@ export class OpenCodeClient {
       throw new Error(`Failed to generate response: ${JSON.stringify(response.error)}`);
     }
      
-    const data = response.data as any;
-     
-    // Extract text
-    if (data.parts) {
-      return data.parts.map((p: any) => p.text || '').join('');
+    return extractResponseText(response.data as PromptResponseData);
+  }
+
+  /**
+   * Stream response text as the CLI writes it
+   *
+   * In CLI mode output is yielded as it arrives, with the <output> wrapper
+   * stripped on the fly, so callers see the first lines without waiting for
+   * the whole generation to finish. Server and auto modes yield the complete
+   * response once it is available.
+   *
+   * @param inputs - Prompt string or object with prompt
+   * @returns Async generator yielding text chunks
+   */
+  async *generateStream(inputs: { prompt: string } | string): AsyncGenerator<string, void, unknown> {
+    const prompt = typeof inputs === 'string' ? inputs : inputs.prompt;
+
+    if (this.mode !== 'cli') {
+      yield await this.generate(prompt);
+      return;
     }
-    if (data.text) {
-      return data.text;
+
+    const process = spawn(this.cliPath, this.buildCliArgs(prompt), {
+      stdio: ['ignore', 'pipe', 'pipe']
+    });
+    const stdoutDecoder = new StringDecoder('utf8');
+    const stderrTail = new StderrTail();
+    const filter = new OutputTagFilter();
+    const chunks: string[] = [];
+    let finished = false;
+    let failure: Error | null = null;
+    let wake: (() => void) | null = null;
+
+    const notify = () => {
+      const resume = wake;
+      wake = null;
+      resume?.();
+    };
+
+    process.stdout.on('data', d => {
+      chunks.push(stdoutDecoder.write(d));
+      notify();
+    });
+    process.stderr.on('data', d => {
+      stderrTail.push(d);
+    });
+    const timeoutId = setTimeout(() => {
+      process.kill();
+      failure = new Error(`OpenCode CLI timed out after ${this.timeout}ms`);
+      finished = true;
+      notify();
+    }, this.timeout);
+
+    process.on('close', code => {
+      clearTimeout(timeoutId);
+      if (finished) return;
+      chunks.push(stdoutDecoder.end());
+      if (code !== 0) {
+        failure = new Error(`OpenCode CLI failed (exit code ${code})\nSTDERR: ${stderrTail.end()}`);
+      }
+      finished = true;
+      notify();
+    });
+    process.on('error', (err) => {
+      clearTimeout(timeoutId);
+      failure = err;
+      finished = true;
+      notify();
+    });
+
+    try {
+      while (true) {
+        if (chunks.length > 0) {
+          const text = filter.push(chunks.splice(0).join(''));
+          if (text) yield text;
+        } else if (finished) {
+          break;
+        } else {
+          await new Promise<void>((resolve) => { wake = resolve; });
+        }
+      }
+    } finally {
+      // The consumer stopped early (break, return or throw); don't leave the
+      // agent running with nobody reading its output
+      if (!finished) {
+        clearTimeout(timeoutId);
+        process.kill();
+      }
     }
-    return JSON.stringify(data);
+
+    if (failure) throw failure;
+    const rest = filter.end();
+    if (rest) yield rest;
   }
 
-  private async generateViaCli(prompt: string): Promise<string> {
+  private buildCliArgs(prompt: string): string[] {
     const args = ['run'];
     if (this.model) {
       args.push('--model', this.model);
     }
     args.push(prompt);
+    return args;
+  }
+
+  private async generateViaCli(prompt: string): Promise<string> {
+    const args = this.buildCliArgs(prompt);
     
     return new Promise((resolve, reject) => {
       const process = spawn(this.cliPath, args, {
         stdio: ['ignore', 'pipe', 'pipe']
       });
-      let stdout = '';
-      let stderr = '';
+      // Chunks are decoded incrementally (keeping split multi-byte characters
+      // intact) and joined once when the process exits
+      const stdoutDecoder = new StringDecoder('utf8');
+      const stdoutParts: string[] = [];
+      const stderrTail = new StderrTail();
       
       process.stdout.on('data', d => {
-        stdout += d.toString();
+        stdoutParts.push(stdoutDecoder.write(d));
       });
       process.stderr.on('data', d => {
-        stderr += d.toString();
+        stderrTail.push(d);
       });
+
+      const timeoutId = setTimeout(() => {
+        process.kill();
+        reject(new Error(`OpenCode CLI timed out after ${this.timeout}ms`));
+      }, this.timeout);
       
       process.on('close', code => {
+        clearTimeout(timeoutId);
         if (code === 0) {
-           let output = stdout.trim();
-           // Strip <output> tags if present
-           if (output.startsWith('<output>') && output.endsWith('</output>')) {
-             output = output.slice(8, -9).trim();
-           }
-           resolve(output);
+           stdoutParts.push(stdoutDecoder.end());
+           // Strip <output> tags the same way generateStream does
+           const filter = new OutputTagFilter();
+           resolve(filter.push(stdoutParts.join('')) + filter.end());
         } else {
-           reject(new Error(`OpenCode CLI failed (exit code ${code})\nSTDERR: ${stderr}`));
+           reject(new Error(`OpenCode CLI failed (exit code ${code})\nSTDERR: ${stderrTail.end()}`));
         }
       });
       
       process.on('error', (err) => {
+        clearTimeout(timeoutId);
         reject(err);
       });
     });
@@ -168,6 +400,7 @@ export const OpenCodeInitializer: SDKInitializer = {
       cliPath: options['cliPath'] as string,
       model: options['model'] as string,
       excludeFiles: options['excludeFiles'] as string[],
+      timeout: options['timeout'] as number,
     });
   },
 };
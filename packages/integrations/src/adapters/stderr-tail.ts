@@ -0,0 +1,33 @@
+import { StringDecoder } from 'node:string_decoder';
+
+/**
+ * Only the end of a CLI's stderr is kept for error messages; a chatty or
+ * stuck process can write megabytes of logs that would otherwise be held in
+ * memory until it exits.
+ */
+const STDERR_TAIL_CHARS = 8192;
+
+export class StderrTail {
+  private text = '';
+  private truncated = false;
+  private readonly decoder = new StringDecoder('utf8');
+
+  push(chunk: Buffer | string): void {
+    this.text += typeof chunk === 'string' ? chunk : this.decoder.write(chunk);
+    // Let the buffer grow to twice the limit between trims so long runs of
+    // small chunks are not re-sliced on every write
+    if (this.text.length > STDERR_TAIL_CHARS * 2) {
+      this.text = this.text.slice(-STDERR_TAIL_CHARS);
+      this.truncated = true;
+    }
+  }
+
+  end(): string {
+    this.text += this.decoder.end();
+    if (this.text.length > STDERR_TAIL_CHARS) {
+      this.text = this.text.slice(-STDERR_TAIL_CHARS);
+      this.truncated = true;
+    }
+    return this.truncated ? `...${this.text}` : this.text;
+  }
+}
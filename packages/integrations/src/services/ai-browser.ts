@@ -60,6 +60,75 @@ export interface AIExtractOptions {
   schema?: Record<string, unknown>;
 }
 
+// ============================================================================
+// JSON Extraction
+// ============================================================================
+
+const JSON_BLOCK_PATTERN = /```json\s*([\s\S]*?)\s*```/;
+
+const CLOSING_BRACKETS: Record<string, string> = { '{': '}', '[': ']' };
+
+/**
+ * Extract the first balanced JSON object or array from model output
+ *
+ * Prefers a non-empty fenced ```json block that starts with an accepted
+ * opener, then scans for opening brackets and walks forward from each one
+ * tracking nesting depth and string state. This avoids the backtracking cost
+ * of greedy `[\s\S]*` patterns on long responses and stops at the end of the
+ * first value instead of the last closing brace. A candidate that is
+ * unbalanced or does not parse (such as "[note]" in prose) is skipped in
+ * favour of the next opener.
+ *
+ * @param text - Raw model response
+ * @param openers - Opening brackets to accept ('{', '[' or both)
+ * @returns The JSON substring, or null if none is found
+ */
+export function extractJson(text: string, openers = '{['): string | null {
+  const fenced = JSON_BLOCK_PATTERN.exec(text);
+  if (fenced && fenced[1].length > 0 && openers.includes(fenced[1].charAt(0))) {
+    return fenced[1];
+  }
+
+  for (let start = 0; start < text.length; start++) {
+    if (!openers.includes(text[start])) continue;
+    const candidate = scanBalanced(text, start);
+    if (candidate === null) continue;
+    try {
+      JSON.parse(candidate);
+      return candidate;
+    } catch {
+      // Not JSON after all; try the next opener
+    }
+  }
+  return null;
+}
+
+/**
+ * Return the bracketed value starting at `start`, or null if it is unbalanced
+ */
+function scanBalanced(text: string, start: number): string | null {
+  const stack: string[] = [];
+  let inString = false;
+  for (let i = start; i < text.length; i++) {
+    const ch = text[i];
+    if (inString) {
+      if (ch === '\\') {
+        i++;
+      } else if (ch === '"') {
+        inString = false;
+      }
+    } else if (ch === '"') {
+      inString = true;
+    } else if (ch === '{' || ch === '[') {
+      stack.push(CLOSING_BRACKETS[ch]);
+    } else if (ch === '}' || ch === ']') {
+      if (stack.pop() !== ch) return null;
+      if (stack.length === 0) return text.slice(start, i + 1);
+    }
+  }
+  return null;
+}
+
 // ============================================================================
 // AI Browser Client
 // ============================================================================
@@ -334,7 +403,7 @@ Current Page URL: ${url}
 
 Extraction Task: ${instruction}
 
-${schema ? `Expected JSON Schema:\n${JSON.stringify(schema, null, 2)}\n` : ''}
+${schema ? `Expected JSON Schema:\n${JSON.stringify(schema)}\n` : ''}
 HTML Content:
 ${truncatedHtml}
 
@@ -357,13 +426,13 @@ JSON:`;
   private parseActionResponse(response: string): { action: string; inputs: Record<string, unknown> } | null {
     try {
       // Extract JSON from response (handle markdown code blocks)
-      const jsonMatch = response.match(/\{[\s\S]*\}/);
-      if (!jsonMatch) {
+      const json = extractJson(response, '{');
+      if (!json) {
         console.error('[AI Browser] No JSON found in response:', response);
         return null;
       }
 
-      const parsed = JSON.parse(jsonMatch[0]);
+      const parsed = JSON.parse(json);
 
       if (!parsed.action || !parsed.inputs) {
         console.error('[AI Browser] Invalid action format:', parsed);
@@ -380,13 +449,13 @@ JSON:`;
   private parseObserveResponse(response: string): ObservedElement[] {
     try {
       // Extract JSON array from response
-      const jsonMatch = response.match(/\[[\s\S]*\]/);
-      if (!jsonMatch) {
+      const json = extractJson(response, '[');
+      if (!json) {
         console.error('[AI Browser] No JSON array found in response');
         return [];
       }
 
-      const parsed = JSON.parse(jsonMatch[0]);
+      const parsed = JSON.parse(json);
 
       if (!Array.isArray(parsed)) {
         console.error('[AI Browser] Response is not an array');
@@ -403,12 +472,12 @@ JSON:`;
   private parseExtractResponse(response: string): unknown {
     try {
       // Extract JSON from response
-      const jsonMatch = response.match(/\{[\s\S]*\}|\[[\s\S]*\]/);
-      if (!jsonMatch) {
+      const json = extractJson(response);
+      if (!json) {
         throw new Error('No JSON found in AI response');
       }
 
-      return JSON.parse(jsonMatch[0]);
+      return JSON.parse(json);
     } catch (error) {
       throw new Error(`Failed to parse extraction response: ${error instanceof Error ? error.message : String(error)}`);
     }
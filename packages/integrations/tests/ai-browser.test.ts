@@ -0,0 +1,39 @@
+import { describe, it, expect } from 'vitest';
+import { extractJson } from '../src/services/ai-browser.js';
+
+describe('AI Browser JSON extraction', () => {
+  it('should prefer a fenced json block', () => {
+    const response = 'Sure!\n```json\n{"action": "click", "inputs": {}}\n```\nDone {not json}';
+    expect(extractJson(response)).toBe('{"action": "click", "inputs": {}}');
+  });
+
+  it('should stop at the end of the first balanced object', () => {
+    const response = 'Result: {"a": {"b": [1, 2]}} and later a stray }';
+    expect(extractJson(response)).toBe('{"a": {"b": [1, 2]}}');
+  });
+
+  it('should ignore brackets inside strings', () => {
+    const response = '{"text": "closing } and \\" quote [", "ok": true}';
+    expect(JSON.parse(extractJson(response)!)).toEqual({ text: 'closing } and " quote [', ok: true });
+  });
+
+  it('should restrict to the requested opener', () => {
+    const response = 'Meta {"x": 1} then [{"selector": "#a"}]';
+    expect(extractJson(response, '[')).toBe('[{"selector": "#a"}]');
+  });
+
+  it('should fall through to the scanner for an empty or non-json fence', () => {
+    expect(extractJson('```json\n```\nthen {"a": 1}')).toBe('{"a": 1}');
+    expect(extractJson('```json\nnope\n```\n{"b": 2}')).toBe('{"b": 2}');
+  });
+
+  it('should skip bracketed prose and try later candidates', () => {
+    expect(extractJson('[note] see {curly} then {"c": 3}')).toBe('{"c": 3}');
+  });
+
+  it('should return null when no balanced value exists', () => {
+    expect(extractJson('no json here')).toBeNull();
+    expect(extractJson('{"a": [1}')).toBeNull();
+    expect(extractJson('{"unterminated": true')).toBeNull();
+  });
+});
@@ -423,3 +423,51 @@ describe('Claude Agent Client Methods', () => {
     expect(client.getSessionId()).toBeNull();
   });
 });
+
+describe('Claude Agent Streaming', () => {
+  afterEach(() => {
+    vi.clearAllMocks();
+  });
+
+  async function collect(stream: AsyncGenerator<string, void, unknown>): Promise<string[]> {
+    const chunks: string[] = [];
+    for await (const chunk of stream) {
+      chunks.push(chunk);
+    }
+    return chunks;
+  }
+
+  it('should yield partial deltas as they arrive', async () => {
+    const sdk = await import('@anthropic-ai/claude-agent-sdk');
+    (sdk.query as any).mockReturnValue(
+      (async function* () {
+        yield { type: 'partial', delta: 'Hel' };
+        yield { type: 'partial', delta: 'lo' };
+        yield { type: 'assistant', message: { role: 'assistant', content: 'Hello' } };
+        yield { type: 'result', result: 'Hello', session_id: 'sess-1' };
+      })()
+    );
+
+    const client = new ClaudeAgentClient();
+    const chunks = await collect(client.generateStream('Say hello'));
+
+    expect(chunks).toEqual(['Hel', 'lo']);
+    expect(client.getSessionId()).toBe('sess-1');
+  });
+
+  it('should fall back to assistant text when no partials are emitted', async () => {
+    const sdk = await import('@anthropic-ai/claude-agent-sdk');
+    (sdk.query as any).mockReturnValue(
+      (async function* () {
+        yield {
+          type: 'assistant',
+          message: { role: 'assistant', content: [{ type: 'text', text: 'Full answer' }] },
+        };
+        yield { type: 'result', result: 'Full answer' };
+      })()
+    );
+
+    const client = new ClaudeAgentClient();
+    expect(await collect(client.generateStream({ prompt: 'Question' }))).toEqual(['Full answer']);
+  });
+});
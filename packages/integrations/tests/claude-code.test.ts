@@ -44,6 +44,7 @@ describe('Claude Code Integration', () => {
     mockProcess.stdout = new EventEmitter();
     mockProcess.stderr = new EventEmitter();
     mockProcess.kill = vi.fn();
+    mockProcess.stdin = { on: vi.fn(), end: vi.fn() };
     
     (spawn as any).mockReturnValue(mockProcess);
 
@@ -56,6 +57,189 @@ describe('Claude Code Integration', () => {
 
     const result = await promise;
     expect(result).toBe('Response from Claude');
-    expect(spawn).toHaveBeenCalledWith('claude', ['-p', 'Hello'], expect.anything());
+    expect(spawn).toHaveBeenCalledWith('claude', ['-p'], expect.anything());
+    expect(mockProcess.stdin.end).toHaveBeenCalledWith('Hello');
+  });
+
+  it('should keep multi-byte characters split across output chunks intact', async () => {
+    const client = new ClaudeCodeClient({});
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    mockProcess.kill = vi.fn();
+    mockProcess.stdin = { on: vi.fn(), end: vi.fn() };
+
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+
+    const bytes = Buffer.from('Résumé ✓');
+    mockProcess.stdout.emit('data', bytes.subarray(0, 2));
+    mockProcess.stdout.emit('data', bytes.subarray(2, bytes.length - 1));
+    mockProcess.stdout.emit('data', bytes.subarray(bytes.length - 1));
+    mockProcess.emit('close', 0);
+
+    expect(await promise).toBe('Résumé ✓');
+  });
+
+  describe('persistent session', () => {
+    function createSessionProcess() {
+      const proc = new EventEmitter() as any;
+      proc.stdout = new EventEmitter();
+      proc.stderr = new EventEmitter();
+      proc.kill = vi.fn();
+      proc.ref = vi.fn();
+      proc.unref = vi.fn();
+      proc.stdin = {
+        on: vi.fn(),
+        write: vi.fn((line: string) => {
+          const { message } = JSON.parse(line);
+          setImmediate(() => {
+            proc.stdout.emit('data', JSON.stringify({ type: 'system', subtype: 'init' }) + '\n');
+            proc.stdout.emit(
+              'data',
+              JSON.stringify({ type: 'result', result: `echo: ${message.content}` }) + '\n'
+            );
+          });
+          return true;
+        }),
+        end: vi.fn(),
+      };
+      return proc;
+    }
+
+    it('should reuse one process across prompts', async () => {
+      const proc = createSessionProcess();
+      (spawn as any).mockReturnValue(proc);
+
+      const client = new ClaudeCodeClient({ persistent: true });
+      const [first, second] = await Promise.all([client.generate('one'), client.generate('two')]);
+
+      expect(first).toBe('echo: one');
+      expect(second).toBe('echo: two');
+      expect(spawn).toHaveBeenCalledTimes(1);
+      expect(spawn).toHaveBeenCalledWith(
+        'claude',
+        expect.arrayContaining(['--input-format', 'stream-json', '--output-format', 'stream-json']),
+        expect.anything()
+      );
+
+      client.close();
+      expect(proc.stdin.end).toHaveBeenCalled();
+    });
+
+    it('should release the event loop while the session is idle', async () => {
+      const proc = createSessionProcess();
+      (spawn as any).mockReturnValue(proc);
+
+      const client = new ClaudeCodeClient({ persistent: true });
+      await client.generate('one');
+
+      expect(proc.ref).toHaveBeenCalledTimes(1);
+      expect(proc.unref).toHaveBeenCalledTimes(1);
+      client.close();
+    });
+
+    it('should start a new session after a turn times out', async () => {
+      const stuck = createSessionProcess();
+      stuck.stdin.write = vi.fn(() => true);
+      const fresh = createSessionProcess();
+      (spawn as any).mockReturnValueOnce(stuck).mockReturnValueOnce(fresh);
+
+      const client = new ClaudeCodeClient({ persistent: true, timeout: 10 });
+
+      await expect(client.generate('one')).rejects.toThrow('timed out');
+      expect(stuck.kill).toHaveBeenCalled();
+      expect(await client.generate('two')).toBe('echo: two');
+      expect(spawn).toHaveBeenCalledTimes(2);
+      client.close();
+    });
+
+    it('should ignore a timed-out session that exits after the next turn starts', async () => {
+      const stuck = createSessionProcess();
+      stuck.stdin.write = vi.fn(() => true);
+      // The killed process still flushes a result and exits, but only once the
+      // next turn is already waiting on a fresh session
+      stuck.kill = vi.fn(() => {
+        setTimeout(() => {
+          stuck.stdout.emit('data', JSON.stringify({ type: 'result', result: 'stale' }) + '\n');
+          stuck.emit('close', null);
+        }, 5);
+      });
+      const fresh = createSessionProcess();
+      const respond = fresh.stdin.write;
+      fresh.stdin.write = vi.fn((line: string) => {
+        setTimeout(() => respond(line), 20);
+        return true;
+      });
+      (spawn as any).mockReturnValueOnce(stuck).mockReturnValueOnce(fresh);
+
+      const client = new ClaudeCodeClient({ persistent: true, timeout: 50 });
+
+      await expect(client.generate('one')).rejects.toThrow('timed out');
+      expect(await client.generate('two')).toBe('echo: two');
+      // Persistent mode stays on and the fresh session keeps serving turns
+      expect(await client.generate('three')).toBe('echo: three');
+      expect(spawn).toHaveBeenCalledTimes(2);
+      client.close();
+    });
+
+    it('should assemble result events split across many chunks', async () => {
+      const proc = createSessionProcess();
+      proc.stdin.write = vi.fn(() => {
+        const result = JSON.stringify({ type: 'result', result: 'x'.repeat(5000) });
+        setImmediate(() => {
+          for (let i = 0; i < result.length; i += 64) {
+            proc.stdout.emit('data', result.slice(i, i + 64));
+          }
+          proc.stdout.emit('data', '\n' + JSON.stringify({ type: 'system' }) + '\n');
+        });
+        return true;
+      });
+      (spawn as any).mockReturnValue(proc);
+
+      const client = new ClaudeCodeClient({ persistent: true });
+
+      expect(await client.generate('long')).toBe('x'.repeat(5000));
+      client.close();
+    });
+
+    it('should fall back to per-call spawn when the session exits immediately', async () => {
+      const session = new EventEmitter() as any;
+      session.stdout = new EventEmitter();
+      session.stderr = new EventEmitter();
+      session.kill = vi.fn();
+      session.ref = vi.fn();
+      session.unref = vi.fn();
+      session.stdin = {
+        on: vi.fn(),
+        write: vi.fn(() => {
+          setImmediate(() => session.emit('close', 1));
+          return true;
+        }),
+        end: vi.fn(),
+      };
+
+      const oneShot = new EventEmitter() as any;
+      oneShot.stdout = new EventEmitter();
+      oneShot.stderr = new EventEmitter();
+      oneShot.kill = vi.fn();
+      oneShot.stdin = { on: vi.fn(), end: vi.fn() };
+
+      (spawn as any).mockReturnValueOnce(session).mockReturnValueOnce(oneShot);
+
+      const client = new ClaudeCodeClient({ persistent: true });
+      const promise = client.generate('Hello');
+
+      await new Promise((resolve) => setImmediate(resolve));
+      await new Promise((resolve) => setImmediate(resolve));
+      oneShot.stdout.emit('data', 'Fallback response');
+      oneShot.emit('close', 0);
+
+      expect(await promise).toBe('Fallback response');
+      expect(spawn).toHaveBeenLastCalledWith('claude', ['-p'], expect.anything());
+      expect(oneShot.stdin.end).toHaveBeenCalledWith('Hello');
+    });
   });
 });
@@ -10,7 +10,30 @@ vi.mock('node:child_process', () => {
   };
 });
 
+const { sessionCreate, sessionPrompt } = vi.hoisted(() => ({
+  sessionCreate: vi.fn(),
+  sessionPrompt: vi.fn(),
+}));
+
+vi.mock('@opencode-ai/sdk', () => ({
+  createOpencodeClient: vi.fn(() => ({
+    session: { create: sessionCreate, prompt: sessionPrompt },
+  })),
+}));
+
 import { spawn } from 'node:child_process';
+import { createOpencodeClient } from '@opencode-ai/sdk';
+
+function mockCliProcess(output: string) {
+  const proc = new EventEmitter() as any;
+  proc.stdout = new EventEmitter();
+  proc.stderr = new EventEmitter();
+  setImmediate(() => {
+    proc.stdout.emit('data', output);
+    proc.emit('close', 0);
+  });
+  return proc;
+}
 
 describe('OpenCode Integration', () => {
   afterEach(() => {
@@ -58,6 +81,154 @@ describe('OpenCode Integration', () => {
     expect(spawn).toHaveBeenCalledWith('opencode', ['run', 'Hello'], expect.objectContaining({ stdio: ['ignore', 'pipe', 'pipe'] }));
   });
 
+  it('should join multi-byte CLI output split across chunks', async () => {
+    const client = new OpenCodeClient({ mode: 'cli' });
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+
+    const bytes = Buffer.from('<output>Ünïcode ✓</output>');
+    mockProcess.stdout.emit('data', bytes.subarray(0, 9));
+    mockProcess.stdout.emit('data', bytes.subarray(9, 19));
+    mockProcess.stdout.emit('data', bytes.subarray(19));
+    mockProcess.emit('close', 0);
+
+    expect(await promise).toBe('Ünïcode ✓');
+  });
+
+  it('should report only the tail of a large CLI stderr', async () => {
+    const client = new OpenCodeClient({ mode: 'cli' });
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+
+    for (let i = 0; i < 100; i++) {
+      mockProcess.stderr.emit('data', Buffer.from(`log line ${i}\n`.padEnd(1024, '.')));
+    }
+    mockProcess.stderr.emit('data', Buffer.from('fatal: out of tokens'));
+    mockProcess.emit('close', 1);
+
+    const error: Error = await promise.catch((e) => e);
+    expect(error.message).toContain('STDERR: ...');
+    expect(error.message).toMatch(/fatal: out of tokens$/);
+    expect(error.message).not.toContain('log line 0\n');
+    expect(error.message.length).toBeLessThan(8500);
+  });
+
+  describe('generateStream', () => {
+    it('should yield CLI output before the process exits', async () => {
+      const client = new OpenCodeClient({ mode: 'cli' });
+
+      const mockProcess = new EventEmitter() as any;
+      mockProcess.stdout = new EventEmitter();
+      mockProcess.stderr = new EventEmitter();
+      (spawn as any).mockReturnValue(mockProcess);
+
+      const stream = client.generateStream('Hello');
+      const first = stream.next();
+
+      mockProcess.stdout.emit('data', '<output>First line\n');
+      mockProcess.stdout.emit('data', 'Second line');
+      const firstChunk = (await first).value as string;
+      expect(firstChunk.startsWith('First line')).toBe(true);
+
+      const rest = (async () => {
+        const chunks: string[] = [];
+        for await (const chunk of stream) chunks.push(chunk);
+        return chunks.join('');
+      })();
+      mockProcess.stdout.emit('data', ' done</output>\n');
+      mockProcess.emit('close', 0);
+
+      expect(firstChunk + (await rest)).toBe('First line\nSecond line done');
+    });
+
+    it('should throw when the CLI fails', async () => {
+      const client = new OpenCodeClient({ mode: 'cli' });
+
+      const mockProcess = new EventEmitter() as any;
+      mockProcess.stdout = new EventEmitter();
+      mockProcess.stderr = new EventEmitter();
+      (spawn as any).mockReturnValue(mockProcess);
+
+      const consume = (async () => {
+        for await (const _chunk of client.generateStream('Hello')) {
+          // drain
+        }
+      })();
+      mockProcess.stderr.emit('data', 'boom');
+      mockProcess.emit('close', 1);
+
+      await expect(consume).rejects.toThrow('OpenCode CLI failed (exit code 1)');
+    });
+
+    it('should return the same text as generate for the same CLI output', async () => {
+      const client = new OpenCodeClient({ mode: 'cli' });
+      const outputs = [
+        '<output>\nWrapped answer\n</output>\n',
+        '<output>Opening tag only\n',
+        'Plain answer mentioning </output>',
+      ];
+
+      for (const output of outputs) {
+        (spawn as any).mockImplementation(() => mockCliProcess(output));
+        const generated = await client.generate('Hello');
+
+        const chunks: string[] = [];
+        for await (const chunk of client.generateStream('Hello')) chunks.push(chunk);
+
+        expect(chunks.join('')).toBe(generated);
+      }
+    });
+
+    it('should kill the CLI when the consumer stops early', async () => {
+      const client = new OpenCodeClient({ mode: 'cli' });
+
+      const mockProcess = new EventEmitter() as any;
+      mockProcess.stdout = new EventEmitter();
+      mockProcess.stderr = new EventEmitter();
+      mockProcess.kill = vi.fn();
+      (spawn as any).mockReturnValue(mockProcess);
+
+      const consume = (async () => {
+        for await (const chunk of client.generateStream('Hello')) {
+          return chunk;
+        }
+      })();
+      mockProcess.stdout.emit('data', 'First line\n');
+
+      expect(await consume).toBe('First line');
+      expect(mockProcess.kill).toHaveBeenCalled();
+    });
+
+    it('should time out a stalled CLI', async () => {
+      const client = new OpenCodeClient({ mode: 'cli', timeout: 10 });
+
+      const mockProcess = new EventEmitter() as any;
+      mockProcess.stdout = new EventEmitter();
+      mockProcess.stderr = new EventEmitter();
+      mockProcess.kill = vi.fn();
+      (spawn as any).mockReturnValue(mockProcess);
+
+      const consume = (async () => {
+        for await (const _chunk of client.generateStream('Hello')) {
+          // drain
+        }
+      })();
+
+      await expect(consume).rejects.toThrow('OpenCode CLI timed out after 10ms');
+      expect(mockProcess.kill).toHaveBeenCalled();
+    });
+  });
+
   it('should initialize with excludeFiles option', async () => {
     const config = {
       sdk: 'opencode',
@@ -70,4 +241,89 @@ describe('OpenCode Integration', () => {
     const client = await OpenCodeInitializer.initialize({}, config);
     expect(client).toBeInstanceOf(OpenCodeClient);
   });
+
+  describe('auto mode', () => {
+    it('should skip the server for a while after it fails', async () => {
+      sessionCreate.mockRejectedValue(new Error('connect ECONNREFUSED'));
+      (spawn as any).mockImplementation(() => mockCliProcess('From CLI'));
+
+      const client = new OpenCodeClient({ mode: 'auto', serverUrl: 'http://localhost:5001' });
+
+      expect(await client.generate('First')).toBe('From CLI');
+      expect(await client.generate('Second')).toBe('From CLI');
+
+      expect(sessionCreate).toHaveBeenCalledTimes(1);
+      expect(spawn).toHaveBeenCalledTimes(2);
+    });
+
+    it('should back off further after consecutive server failures', async () => {
+      sessionCreate.mockRejectedValue(new Error('connect ECONNREFUSED'));
+      (spawn as any).mockImplementation(() => mockCliProcess('From CLI'));
+      const now = vi.spyOn(performance, 'now');
+
+      try {
+        const client = new OpenCodeClient({ mode: 'auto', serverUrl: 'http://localhost:5004' });
+
+        now.mockReturnValue(0);
+        await client.generate('First');
+        now.mockReturnValue(1000);
+        await client.generate('Second');
+        expect(sessionCreate).toHaveBeenCalledTimes(2);
+
+        // The second failure doubles the wait to two seconds
+        now.mockReturnValue(2500);
+        await client.generate('Third');
+        expect(sessionCreate).toHaveBeenCalledTimes(2);
+
+        now.mockReturnValue(3000);
+        await client.generate('Fourth');
+        expect(sessionCreate).toHaveBeenCalledTimes(3);
+      } finally {
+        now.mockRestore();
+      }
+    });
+
+    it('should keep using the server while it succeeds', async () => {
+      sessionCreate.mockResolvedValue({ data: { id: 'session-1' } });
+      sessionPrompt.mockResolvedValue({ data: { parts: [{ type: 'text', text: 'From server' }] } });
+
+      const client = new OpenCodeClient({ mode: 'auto', serverUrl: 'http://localhost:5002' });
+
+      expect(await client.generate('First')).toBe('From server');
+      expect(await client.generate('Second')).toBe('From server');
+
+      expect(sessionPrompt).toHaveBeenCalledTimes(2);
+      expect(spawn).not.toHaveBeenCalled();
+    });
+
+    it('should return only text parts from server replies', async () => {
+      sessionCreate.mockResolvedValue({ data: { id: 'session-1' } });
+      sessionPrompt.mockResolvedValue({
+        data: {
+          parts: [
+            { type: 'step-start' },
+            { type: 'reasoning', text: 'Thinking it over. ' },
+            { type: 'text', text: 'Final ' },
+            { type: 'text', text: 'answer' },
+          ],
+        },
+      });
+
+      const client = new OpenCodeClient({ mode: 'server', serverUrl: 'http://localhost:5005' });
+
+      expect(await client.generate('Question')).toBe('Final answer');
+    });
+
+    it('should share one SDK client per server URL', async () => {
+      sessionCreate.mockResolvedValue({ data: { id: 'session-1' } });
+      sessionPrompt.mockResolvedValue({ data: { parts: [{ type: 'text', text: 'From server' }] } });
+
+      await new OpenCodeClient({ mode: 'server', serverUrl: 'http://localhost:5003' }).generate('One');
+      await new OpenCodeClient({ mode: 'server', serverUrl: 'http://localhost:5003' }).generate('Two');
+      new OpenCodeClient({ mode: 'cli', serverUrl: 'http://localhost:5003' });
+
+      expect(createOpencodeClient).toHaveBeenCalledTimes(1);
+      expect(createOpencodeClient).toHaveBeenCalledWith({ baseUrl: 'http://localhost:5003' });
+    });
+  });
 });